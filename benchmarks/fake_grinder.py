@@ -0,0 +1,328 @@
+"""Fake Mahlkönig X54 grinders for benchmarking.
+
+Each fake grinder binds its own loopback address (127.0.0.2, 127.0.0.3, ...)
+and serves the X54 WebSocket API on the WebSocket port and the raw statistics
+endpoint on port 80, exactly where `mahlkoenig.Grinder` expects them. Port 80
+is also where the benchmark controls the fake:
+
+    POST /_fake/sleep            close the WebSocket port, like a sleeping X54
+    POST /_fake/wake             reopen it
+    POST /_fake/grind?seconds=3  run a grind, pushing SystemStatus frames
+
+Run standalone with `python benchmarks/fake_grinder.py --count 10`.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from time import monotonic
+
+from aiohttp import WSMsgType, web
+
+_LOGGER = logging.getLogger(__name__)
+
+WEBSOCKET_PORT = 9998
+HTTP_PORT = 80
+FIRST_ADDRESS = 2  # 127.0.0.1 is left alone
+PUSH_INTERVAL = 0.1
+
+
+def grinder_address(index: int) -> str:
+    """Return the loopback address of the fake grinder with this index."""
+    number = FIRST_ADDRESS + index
+    return f"127.0.{number // 256}.{number % 256}"
+
+
+@dataclass
+class FakeGrinderState:
+    """Mutable device state of one fake grinder."""
+
+    serial_no: str
+    address: str
+    password: str = ""
+    auto_sleep_time: int = 300
+    active_menu: int = 1
+    grind_started: float | None = None
+    grind_until: float = 0.0
+    total_grind_shots: int = 0
+    total_grind_time: float = 0.0
+    recipe_shots: list[int] = field(default_factory=lambda: [0, 0, 0, 0])
+    recipe_time: list[float] = field(default_factory=lambda: [0.0] * 4)
+
+    @property
+    def grind_running(self) -> bool:
+        return self.grind_started is not None
+
+    def grind_time_ms(self) -> int:
+        if self.grind_started is None:
+            return 0
+        return int((monotonic() - self.grind_started) * 1000)
+
+    def machine_info(self) -> dict:
+        return {
+            "SerialNo": self.serial_no,
+            "ProductNo": "X54-FAKE",
+            "SwVersion": "1.0.0",
+            "SwBuildNo": 1,
+            "DiscLifeTime": 3600,
+            "Hostname": f"mahlkoenig-x54-grinder-{self.serial_no}",
+            **self._network(),
+        }
+
+    def wifi_info(self) -> dict:
+        return {"WifiMode": 1, **self._network()}
+
+    def _network(self) -> dict:
+        return {
+            "ApMacAddress": "",
+            "CurrentApIpv4": "",
+            "StaMacAddress": "02:00:00:00:00:01",
+            "CurrentStaIpv4": self.address,
+        }
+
+    def system_status(self) -> dict:
+        return {
+            "GrindRunning": self.grind_running,
+            "ErrorCode": "",
+            "ActiveMenu": self.active_menu,
+            "GrindTimeMs": self.grind_time_ms(),
+        }
+
+    def recipes(self) -> list[dict]:
+        return [
+            {
+                "RecipeNo": recipe_no,
+                "GrindTime": 30 + recipe_no,
+                "Name": f"Recipe {recipe_no}",
+                "BeanName": "Benchmark Blend",
+                "GrindingDegree": 10 * recipe_no,
+                "BrewingType": recipe_no,
+                "Guid": f"{self.serial_no}-{recipe_no}",
+                "LastModifyIndex": 1,
+                "LastModifyTime": datetime(2026, 1, 1, tzinfo=UTC).isoformat(),
+            }
+            for recipe_no in range(1, 5)
+        ]
+
+    def statistics(self) -> str:
+        values = {
+            "SystemRestarts": 3,
+            "TotalGrindShots": self.total_grind_shots,
+            "TotalGrindTime": int(self.total_grind_time),
+            "ManualModeGrindShots": 0,
+            "ManualModeGrindTime": 0,
+            "DiscLifeTime": 3600,
+            "TotalOnTime": 7200,
+            "StandbyTime": 3600,
+            "TotalMotorOnTime": int(self.total_grind_time),
+        }
+        for recipe_no in range(1, 5):
+            values[f"Recipe{recipe_no}GrindShots"] = self.recipe_shots[recipe_no - 1]
+            values[f"Recipe{recipe_no}GrindTime"] = int(
+                self.recipe_time[recipe_no - 1]
+            )
+        for error_no in (1, 2, 3, 4, 8, 9, 10):
+            values[f"TotalErrors{error_no:02}"] = 0
+        return "\n".join(f"{key};{value};" for key, value in values.items())
+
+
+class FakeGrinder:
+    """One fake X54, with its WebSocket and HTTP servers."""
+
+    def __init__(self, state: FakeGrinderState, latency: float) -> None:
+        self.state = state
+        self.latency = latency
+        self._sockets: set[web.WebSocketResponse] = set()
+        self._ws_runner: web.AppRunner | None = None
+        self._http_runner: web.AppRunner | None = None
+        self._session_id = 0
+
+    async def start(self) -> None:
+        ws_app = web.Application()
+        ws_app.router.add_get("/", self._handle_ws)
+        self._ws_runner = web.AppRunner(ws_app)
+        await self._ws_runner.setup()
+        await self.wake()
+
+        http_app = web.Application()
+        http_app.router.add_get("/info", self._handle_statistics)
+        http_app.router.add_post("/_fake/sleep", self._handle_sleep)
+        http_app.router.add_post("/_fake/wake", self._handle_wake)
+        http_app.router.add_post("/_fake/grind", self._handle_grind)
+        self._http_runner = web.AppRunner(http_app)
+        await self._http_runner.setup()
+        await web.TCPSite(self._http_runner, self.state.address, HTTP_PORT).start()
+
+    async def stop(self) -> None:
+        await self.sleep()
+        for runner in (self._ws_runner, self._http_runner):
+            if runner is not None:
+                await runner.cleanup()
+
+    async def sleep(self) -> None:
+        """Drop all connections and stop listening, like a sleeping grinder."""
+        assert self._ws_runner is not None
+        for site in list(self._ws_runner.sites):
+            await site.stop()
+        for ws in list(self._sockets):
+            await ws.close()
+
+    async def wake(self) -> None:
+        assert self._ws_runner is not None
+        if not self._ws_runner.sites:
+            site = web.TCPSite(self._ws_runner, self.state.address, WEBSOCKET_PORT)
+            await site.start()
+
+    async def grind(self, seconds: float) -> None:
+        """Run a grind, pushing a status frame every `PUSH_INTERVAL`."""
+        state = self.state
+        state.grind_started = monotonic()
+        state.grind_until = state.grind_started + seconds
+        while monotonic() < state.grind_until:
+            await self._push_status()
+            await asyncio.sleep(PUSH_INTERVAL)
+        recipe = state.active_menu - 1
+        state.total_grind_shots += 1
+        state.total_grind_time += seconds
+        state.recipe_shots[recipe] += 1
+        state.recipe_time[recipe] += seconds
+        state.grind_started = None
+        await self._push_status()
+
+    async def _push_status(self) -> None:
+        frame = {
+            "MsgId": 0,
+            "SessionId": self._session_id,
+            "SystemStatus": self.state.system_status(),
+        }
+        for ws in list(self._sockets):
+            if not ws.closed:
+                await ws.send_json(frame)
+
+    async def _respond(self, ws: web.WebSocketResponse, frame: dict) -> None:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if not ws.closed:
+            await ws.send_json(frame)
+
+    async def _handle_ws(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self._sockets.add(ws)
+        try:
+            async for msg in ws:
+                if msg.type is not WSMsgType.TEXT:
+                    continue
+                # Answer concurrently, like the device does for pipelined requests.
+                asyncio.create_task(self._handle_frame(ws, json.loads(msg.data)))
+        finally:
+            self._sockets.discard(ws)
+        return ws
+
+    async def _handle_frame(self, ws: web.WebSocketResponse, frame: dict) -> None:
+        state = self.state
+        msg_id = frame["MsgId"]
+        header = {"MsgId": msg_id, "SessionId": self._session_id}
+
+        if "Login" in frame:
+            success = frame["Login"] == state.password
+            if success:
+                self._session_id += 1
+            status = {
+                "SourceMessage": "Login",
+                "Success": success,
+                "Reason": "" if success else "Wrong password",
+            }
+            await self._respond(
+                ws,
+                {"MsgId": msg_id, "SessionId": self._session_id, "ResponseStatus": status},
+            )
+            return
+
+        if "AutoSleepTime" in frame:
+            state.auto_sleep_time = frame["AutoSleepTime"]
+            await self._respond(ws, {**header, "AutoSleepTime": state.auto_sleep_time})
+            return
+
+        match frame.get("RequestType"):
+            case "MachineInfo":
+                await self._respond(ws, {**header, "MachineInfo": state.machine_info()})
+            case "WifiInfo":
+                await self._respond(ws, {**header, "WifiInfo": state.wifi_info()})
+            case "SystemStatus":
+                await self._respond(
+                    ws, {**header, "SystemStatus": state.system_status()}
+                )
+            case "AutoSleepTime":
+                await self._respond(ws, {**header, "AutoSleepTime": state.auto_sleep_time})
+            case "RecipeList":
+                for recipe in state.recipes():
+                    await self._respond(ws, {**header, "Recipe": recipe})
+            case other:
+                _LOGGER.warning("Unknown request type %s", other)
+
+    async def _handle_statistics(self, request: web.Request) -> web.Response:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return web.Response(text=self.state.statistics())
+
+    async def _handle_sleep(self, request: web.Request) -> web.Response:
+        await self.sleep()
+        return web.Response(text="asleep")
+
+    async def _handle_wake(self, request: web.Request) -> web.Response:
+        await self.wake()
+        return web.Response(text="awake")
+
+    async def _handle_grind(self, request: web.Request) -> web.Response:
+        seconds = float(request.query.get("seconds", "3"))
+        asyncio.create_task(self.grind(seconds))
+        return web.Response(text="grinding")
+
+
+async def serve(count: int, latency: float, password: str) -> None:
+    """Run `count` fake grinders until cancelled."""
+    grinders = [
+        FakeGrinder(
+            FakeGrinderState(
+                serial_no=f"FAKE{index:05}",
+                address=grinder_address(index),
+                password=password,
+            ),
+            latency,
+        )
+        for index in range(count)
+    ]
+    try:
+        for grinder in grinders:
+            await grinder.start()
+    except PermissionError as err:
+        raise SystemExit(
+            f"Cannot bind port {HTTP_PORT} on loopback ({err}). Run as root or set "
+            "net.ipv4.ip_unprivileged_port_start=0."
+        ) from err
+    print(f"ready {count}", flush=True)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        for grinder in grinders:
+            await grinder.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=1)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--password", default="")
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.count, args.latency_ms / 1000, args.password))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
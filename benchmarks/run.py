@@ -0,0 +1,289 @@
+"""Benchmark the integration against local fake X54 grinders.
+
+Starts `fake_grinder.py` in a subprocess (so its CPU time isn't counted),
+boots a bare Home Assistant instance in a temporary config directory, adds
+one config entry per fake grinder through the real config flow and then
+measures:
+
+- setup: config flow + `async_setup_entry` + platform setup, all entries at once
+- tick: latency of a steady-state coordinator refresh
+- cpu/tick: Home Assistant process CPU time per refresh
+- writes/tick: entity state writes (changed or reported) per refresh
+- reconnect: refresh latency right after the grinder woke up
+- push: grind start on the fake until `Grinder running` turns on
+
+Usage: python benchmarks/run.py [--grinders 1 10 100] [--latency-ms 0]
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+import aiohttp
+
+from homeassistant import loader
+from homeassistant.bootstrap import async_load_base_functionality
+from homeassistant.components.network.network import async_get_network
+from homeassistant.config_entries import SOURCE_USER, ConfigEntries
+from homeassistant.const import (
+    CONF_HOST,
+    CONF_PASSWORD,
+    CONF_PORT,
+    EVENT_STATE_CHANGED,
+    EVENT_STATE_REPORTED,
+)
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.setup import async_setup_component
+
+from fake_grinder import WEBSOCKET_PORT, grinder_address
+
+REPO = Path(__file__).resolve().parent.parent
+DOMAIN = "mahlkoenig"
+TICKS = 20
+
+
+async def start_fake_grinders(count: int, latency_ms: float) -> asyncio.subprocess.Process:
+    """Start the fake grinders and wait until all of them listen."""
+    process = await asyncio.create_subprocess_exec(
+        sys.executable,
+        str(Path(__file__).with_name("fake_grinder.py")),
+        "--count",
+        str(count),
+        "--latency-ms",
+        str(latency_ms),
+        stdout=asyncio.subprocess.PIPE,
+    )
+    assert process.stdout is not None
+    line = await process.stdout.readline()
+    if not line.startswith(b"ready"):
+        raise SystemExit("fake grinders failed to start")
+    return process
+
+
+async def start_hass(config_dir: Path) -> HomeAssistant:
+    """Boot a Home Assistant core with only what config entries need.
+
+    Follows `bootstrap.async_from_config_dict` up to the point where it sets
+    up the integrations of `configuration.yaml`, which there are none of.
+    """
+    custom_components = config_dir / "custom_components"
+    custom_components.mkdir()
+    (custom_components / DOMAIN).symlink_to(REPO / "custom_components" / DOMAIN)
+    sys.path.insert(0, str(config_dir))
+
+    hass = HomeAssistant(str(config_dir))
+    hass.config.skip_pip = True
+    loader.async_setup(hass)
+    hass.config_entries = ConfigEntries(hass, {})
+    await loader.async_get_custom_components(hass)
+    await async_load_base_functionality(hass)
+    await async_setup_component(hass, "homeassistant", {})
+    # Discovery isn't benchmarked, so zeroconf isn't set up. The grinders'
+    # resolver still uses its instance, which needs the network adapters
+    # (but not the network integration's websocket and http dependencies).
+    await async_get_network(hass)
+    hass.config.components.add("zeroconf")
+    await hass.async_start()
+    return hass
+
+
+class StateWriteCounter:
+    """Counts every entity state write, changed or not."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.count = 0
+        hass.bus.async_listen(EVENT_STATE_CHANGED, self._count)
+        hass.bus.async_listen(
+            EVENT_STATE_REPORTED, self._count, event_filter=self._every
+        )
+
+    @staticmethod
+    @callback
+    def _every(_event_data: object) -> bool:
+        # State reported events are only delivered to filtered listeners.
+        return True
+
+    @callback
+    def _count(self, event: Event) -> None:
+        self.count += 1
+
+
+def summarize(samples: list[float]) -> dict[str, float]:
+    """Return p50/p95 in milliseconds."""
+    if len(samples) < 2:
+        value = samples[0] * 1000 if samples else float("nan")
+        return {"p50_ms": value, "p95_ms": value}
+    cuts = statistics.quantiles(samples, n=20)
+    return {"p50_ms": statistics.median(samples) * 1000, "p95_ms": cuts[18] * 1000}
+
+
+async def timed(call: Callable[[], Awaitable[object]]) -> float:
+    start = time.perf_counter()
+    await call()
+    return time.perf_counter() - start
+
+
+async def control(session: aiohttp.ClientSession, index: int, action: str) -> None:
+    """Send a control request to one fake grinder."""
+    async with session.post(f"http://{grinder_address(index)}/_fake/{action}") as resp:
+        resp.raise_for_status()
+
+
+async def bench(count: int, latency_ms: float) -> dict[str, object]:
+    """Run every measurement for `count` grinders."""
+    fake = await start_fake_grinders(count, latency_ms)
+    with tempfile.TemporaryDirectory() as tmp:
+        try:
+            hass = await start_hass(Path(tmp))
+        except BaseException:
+            fake.terminate()
+            await fake.wait()
+            raise
+        writes = StateWriteCounter(hass)
+        try:
+            async def add_entry(index: int) -> float:
+                return await timed(
+                    lambda: hass.config_entries.flow.async_init(
+                        DOMAIN,
+                        context={"source": SOURCE_USER},
+                        data={
+                            CONF_HOST: grinder_address(index),
+                            CONF_PORT: WEBSOCKET_PORT,
+                            CONF_PASSWORD: "",
+                        },
+                    )
+                )
+
+            start = time.perf_counter()
+            setup_samples = await asyncio.gather(*(add_entry(i) for i in range(count)))
+            setup_wall = time.perf_counter() - start
+            await hass.async_block_till_done()
+
+            coordinators = [
+                entry.runtime_data
+                for entry in hass.config_entries.async_entries(DOMAIN)
+            ]
+
+            tick_samples: list[float] = []
+            writes.count = 0
+            cpu_start = time.process_time()
+            for _ in range(TICKS):
+                tick_samples.extend(
+                    await asyncio.gather(
+                        *(timed(coordinator.async_refresh) for coordinator in coordinators)
+                    )
+                )
+            await hass.async_block_till_done()
+            cpu_per_tick = (time.process_time() - cpu_start) / len(tick_samples)
+            writes_per_tick = writes.count / len(tick_samples)
+
+            async with aiohttp.ClientSession() as session:
+                await asyncio.gather(*(control(session, i, "sleep") for i in range(count)))
+                await asyncio.gather(*(c.async_refresh() for c in coordinators))
+                await asyncio.gather(*(control(session, i, "wake") for i in range(count)))
+                for coordinator in coordinators:
+                    coordinator.breaker.reset()
+                reconnect_samples = await asyncio.gather(
+                    *(timed(c.async_refresh) for c in coordinators)
+                )
+
+                push_latency = await measure_push(hass, session, 0)
+        finally:
+            await hass.async_stop()
+            fake.terminate()
+            await fake.wait()
+
+    return {
+        "grinders": count,
+        "latency_ms": latency_ms,
+        "setup_wall_s": setup_wall,
+        "setup": summarize(list(setup_samples)),
+        "tick": summarize(tick_samples),
+        "cpu_ms_per_tick": cpu_per_tick * 1000,
+        "writes_per_tick": writes_per_tick,
+        "reconnect": summarize(list(reconnect_samples)),
+        "push_ms": push_latency * 1000 if push_latency is not None else None,
+    }
+
+
+async def measure_push(
+    hass: HomeAssistant, session: aiohttp.ClientSession, index: int
+) -> float | None:
+    """Time from starting a grind on the fake until the entity turns on."""
+    entry = next(
+        entry
+        for entry in hass.config_entries.async_entries(DOMAIN)
+        if entry.data[CONF_HOST] == grinder_address(index)
+    )
+    entity_id = er.async_get(hass).async_get_entity_id(
+        "binary_sensor", DOMAIN, f"{entry.runtime_data.serial_no}_grind_running"
+    )
+    if entity_id is None:
+        return None
+    turned_on = asyncio.Event()
+
+    @callback
+    def _on_change(event: Event) -> None:
+        new_state = event.data["new_state"]
+        if event.data["entity_id"] == entity_id and new_state and new_state.state == "on":
+            turned_on.set()
+
+    unsub = hass.bus.async_listen(EVENT_STATE_CHANGED, _on_change)
+    start = time.perf_counter()
+    await control(session, index, "grind?seconds=1")
+    try:
+        async with asyncio.timeout(15):
+            await turned_on.wait()
+    except TimeoutError:
+        return None
+    finally:
+        unsub()
+    return time.perf_counter() - start
+
+
+def print_row(result: dict[str, object]) -> None:
+    setup = result["setup"]
+    tick = result["tick"]
+    reconnect = result["reconnect"]
+    push = "-" if result["push_ms"] is None else f"{result['push_ms']:.0f}"
+    print(
+        f"{result['grinders']:>8} "
+        f"{result['setup_wall_s']:>8.2f}s "
+        f"{setup['p50_ms']:>9.1f} "
+        f"{tick['p50_ms']:>8.1f} {tick['p95_ms']:>8.1f} "
+        f"{result['cpu_ms_per_tick']:>8.2f} "
+        f"{result['writes_per_tick']:>7.1f} "
+        f"{reconnect['p50_ms']:>9.1f} "
+        f"{push:>7}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--grinders", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--output", type=Path, help="also write results as JSON")
+    args = parser.parse_args()
+
+    print(
+        "grinders    setup  setup p50  tick p50 tick p95  cpu/tick  writes"
+        "  reconnect    push"
+    )
+    results = []
+    for count in args.grinders:
+        result = asyncio.run(bench(count, args.latency_ms))
+        print_row(result)
+        results.append(result)
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
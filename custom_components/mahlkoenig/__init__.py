@@ -5,23 +5,55 @@ import logging
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_PORT
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 
-from .const import PLATFORMS
+from .const import CONF_IMPORT_STATISTICS, DOMAIN, PLATFORMS
 from .coordinator import MahlkonigUpdateCoordinator
+from .fleet import DATA_FLEET, async_get_fleet
+from .longterm import async_setup_statistics_import
+from .services import async_setup_services
+from .store import SnapshotStore
 
 _LOGGER = logging.getLogger(__name__)
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the integration."""
+    async_setup_services(hass)
+    return True
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up the integration from a config entry."""
 
     host = entry.data[CONF_HOST]
     port = entry.data[CONF_PORT]
     password = entry.data.get(CONF_PASSWORD, "")
-    coordinator = MahlkonigUpdateCoordinator(hass, entry, host, port, password)
+    fleet = async_get_fleet(hass)
+    fleet.async_register(entry.entry_id)
+    coordinator = MahlkonigUpdateCoordinator(hass, entry, host, port, password, fleet)
     await coordinator.async_config_entry_first_refresh()
 
     entry.runtime_data = coordinator
 
+    if (
+        entry.options.get(CONF_IMPORT_STATISTICS)
+        and "recorder" in hass.config.components
+    ):
+        async_setup_statistics_import(hass, entry, coordinator)
+
+    # The coordinator updates entry.data too; only option changes need a reload.
+    options = dict(entry.options)
+
+    async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+        if entry.options != options:
+            await hass.config_entries.async_reload(entry.entry_id)
+
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     return True
@@ -32,4 +64,18 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
         await entry.runtime_data.grinder.close()
+        fleet = hass.data[DATA_FLEET]
+        fleet.async_unregister(entry.entry_id)
+        if fleet.empty:
+            hass.data.pop(DATA_FLEET)
+            await fleet.async_close()
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the stored grinder state of a removed config entry.
+
+    The entry is unloaded by now, and its coordinator flushed any delayed
+    save on shutdown, so nothing writes the file back.
+    """
+    await SnapshotStore(hass, entry.entry_id).async_remove()
@@ -1,5 +1,7 @@
 """Binary sensor platform for Mahlkönig X54."""
 
+from typing import Any
+
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
     BinarySensorEntity,
@@ -7,11 +9,13 @@ from homeassistant.components.binary_sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .coordinator import MahlkonigUpdateCoordinator
 from .entity import MahlkonigEntity
+from .scheduler import Resource
+from .snapshot import BREAKER
 
 # Coordinator is used to centralize the data updates
 PARALLEL_UPDATES = 0
@@ -33,6 +37,7 @@ async def async_setup_entry(
                     name="Grinder running",
                     entity_category=EntityCategory.DIAGNOSTIC,
                 ),
+                snapshot_keys={Resource.SYSTEM_STATUS},
             ),
             ConnectedBinarySensor(
                 coordinator,
@@ -42,9 +47,9 @@ async def async_setup_entry(
                     device_class=BinarySensorDeviceClass.CONNECTIVITY,
                     entity_category=EntityCategory.DIAGNOSTIC,
                 ),
+                snapshot_keys={BREAKER},
             ),
-        ],
-        update_before_add=True,
+        ]
     )
 
 
@@ -58,16 +63,13 @@ class GrindRunningBinarySensor(
     @property
     def available(self) -> bool:
         """Only available while connected; we don't show stale running state."""
-        return self.coordinator.grinder.connected
+        return self.coordinator.data.connected
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        if not self.coordinator.grinder.connected:
-            return
-        status = self.coordinator.grinder.system_status
-        self._attr_is_on = status.grind_running if status is not None else None
-        super()._handle_coordinator_update()
+    @property
+    def is_on(self) -> bool | None:
+        """True while a shot is running."""
+        status = self.coordinator.data.system_status
+        return status.grind_running if status is not None else None
 
 
 class ConnectedBinarySensor(
@@ -85,4 +87,12 @@ class ConnectedBinarySensor(
     @property
     def is_on(self) -> bool:
         """True when the grinder is reachable."""
-        return self.coordinator.grinder.connected
+        return self.coordinator.data.connected
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Expose the reconnect circuit breaker."""
+        return {
+            "circuit_breaker": self.coordinator.data.breaker_state,
+            "next_probe": self.coordinator.data.next_probe,
+        }
@@ -0,0 +1,103 @@
+"""Connection circuit breaker for Mahlkönig X54."""
+
+import random
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from enum import StrEnum
+from time import monotonic
+
+from homeassistant.util import dt as dt_util
+
+
+class BreakerState(StrEnum):
+    """State of the connection circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Stops connect attempts to a grinder that keeps failing to answer.
+
+    Closed: connect normally. After `failure_threshold` consecutive failures
+    the breaker opens and refuses connects until the next probe is due. The
+    probe delay grows exponentially (with jitter) while probes keep failing.
+    Half-open: a single probe is in flight; success closes the breaker, failure
+    reopens it.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        base_delay: timedelta,
+        max_delay: timedelta,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        """Initialize a closed breaker."""
+        self._failure_threshold = failure_threshold
+        self._base_delay = base_delay.total_seconds()
+        self._max_delay = max_delay.total_seconds()
+        self._clock = clock
+        self._state = BreakerState.CLOSED
+        self._failures = 0
+        self._open_count = 0
+        self._probe_at = 0.0
+        self._next_probe: datetime | None = None
+
+    @property
+    def state(self) -> BreakerState:
+        """Return the current state."""
+        return self._state
+
+    @property
+    def next_probe(self) -> datetime | None:
+        """Return when the next probe is allowed, while the breaker is open."""
+        return self._next_probe if self._state is BreakerState.OPEN else None
+
+    def seconds_until_probe(self) -> float:
+        """Return the seconds until the next probe, 0 unless open."""
+        if self._state is not BreakerState.OPEN:
+            return 0.0
+        return max(self._probe_at - self._clock(), 0.0)
+
+    def allow_request(self) -> bool:
+        """Return True if a connect may be attempted now.
+
+        An open breaker whose probe is due moves to half-open and lets exactly
+        that one attempt through.
+        """
+        if self._state is BreakerState.OPEN:
+            if self._clock() < self._probe_at:
+                return False
+            self._state = BreakerState.HALF_OPEN
+        return True
+
+    def record_success(self) -> None:
+        """Close the breaker after the grinder answered."""
+        self._state = BreakerState.CLOSED
+        self._failures = 0
+        self._open_count = 0
+        self._next_probe = None
+
+    def reset(self) -> None:
+        """Close the breaker without waiting for a probe."""
+        self.record_success()
+
+    def record_failure(self) -> None:
+        """Count a failed connect and open the breaker if needed."""
+        self._failures += 1
+        if (
+            self._state is BreakerState.CLOSED
+            and self._failures < self._failure_threshold
+        ):
+            return
+        exponent = min(self._open_count, 10)
+        self._open_count += 1
+        delay = min(self._base_delay * 2**exponent, self._max_delay)
+        # Jitter keeps grinders that fell asleep together from probing in
+        # lockstep.
+        delay *= random.uniform(0.5, 1.0)
+        self._state = BreakerState.OPEN
+        self._probe_at = self._clock() + delay
+        self._next_probe = dt_util.utcnow() + timedelta(seconds=delay)
@@ -2,18 +2,43 @@
 
 from __future__ import annotations
 
+import asyncio
+from datetime import timedelta
 from typing import Any
 
 import voluptuous as vol
 
-from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
+from homeassistant.config_entries import (
+    ConfigEntry,
+    ConfigEntryState,
+    ConfigFlow,
+    ConfigFlowResult,
+    OptionsFlow,
+)
 from homeassistant.const import CONF_HOST, CONF_PORT, CONF_PASSWORD
 from homeassistant.helpers.service_info.zeroconf import ZeroconfServiceInfo
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.core import callback
+from homeassistant.helpers.selector import (
+    NumberSelector,
+    NumberSelectorConfig,
+    NumberSelectorMode,
+)
 
-from mahlkoenig import Grinder, MahlkoenigAuthenticationError, MahlkoenigConnectionError
+from mahlkoenig import MahlkoenigAuthenticationError, MahlkoenigConnectionError
 
-from .const import DOMAIN
+from .const import (
+    CONF_GRIND_TIMER_RATE,
+    CONF_IMPORT_STATISTICS,
+    CONF_PRODUCT_NO,
+    CONF_SERIAL_NO,
+    CONF_SW_VERSION,
+    DEFAULT_GRIND_TIMER_RATE,
+    DOMAIN,
+)
+from .fleet import async_get_fleet
+from .grinder import MahlkonigGrinder
+
+CONNECT_TIMEOUT = timedelta(seconds=10)
 
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
@@ -23,6 +48,23 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
     }
 )
 
+OPTIONS_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_IMPORT_STATISTICS, default=False): bool,
+        vol.Required(
+            CONF_GRIND_TIMER_RATE, default=DEFAULT_GRIND_TIMER_RATE
+        ): NumberSelector(
+            NumberSelectorConfig(
+                min=0.1,
+                max=10,
+                step=0.1,
+                unit_of_measurement="Hz",
+                mode=NumberSelectorMode.BOX,
+            )
+        ),
+    }
+)
+
 
 class MahlkonigConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Mahlkönig X54."""
@@ -36,6 +78,14 @@ class MahlkonigConfigFlow(ConfigFlow, domain=DOMAIN):
         self._password: str | None = None
         self._device_name: str | None = None
         self._serial_number: str | None = None
+        # Connected and with machine info fetched, until handed to the entry.
+        self._grinder: MahlkonigGrinder | None = None
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
+        """Create the options flow."""
+        return MahlkonigOptionsFlow()
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
@@ -48,54 +98,90 @@ class MahlkonigConfigFlow(ConfigFlow, domain=DOMAIN):
             self._port = user_input[CONF_PORT]
             self._password = user_input[CONF_PASSWORD]
 
-            try:
-                async with Grinder(
-                    host=self._host,
-                    port=self._port,
-                    password=self._password,
-                    session=async_get_clientsession(self.hass),
-                ) as grinder:
-                    await grinder.request_machine_info()
-                    info = grinder.machine_info
-                    self._serial_number = info.serial_no if info is not None else None
-
-                    if self._serial_number:
-                        await self.async_set_unique_id(self._serial_number)
-                        self._abort_if_unique_id_configured(
-                            updates={CONF_HOST: self._host, CONF_PORT: self._port}
-                        )
-
-                    return self.async_create_entry(
-                        title=f"Mahlkönig X54 ({self._host})", data=user_input
+            error = await self._try_connect(self._password)
+            if error is None:
+                assert self._grinder is not None
+                info = self._grinder.machine_info
+                self._serial_number = info.serial_no if info is not None else None
+
+                if self._serial_number:
+                    await self.async_set_unique_id(self._serial_number)
+                    self._abort_if_unique_id_configured(
+                        updates={CONF_HOST: self._host, CONF_PORT: self._port}
                     )
 
-            except MahlkoenigAuthenticationError:
-                errors["base"] = "invalid_auth"
-            except MahlkoenigConnectionError:
-                errors["base"] = "cannot_connect"
+                return self._create_entry(
+                    f"Mahlkönig X54 ({self._host})", self._password
+                )
+            errors["base"] = error
 
         return self.async_show_form(
             step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
         )
 
     async def _try_connect(self, password: str) -> str | None:
-        """Probe the grinder. Returns an error key, or None on success."""
+        """Connect and fetch the machine info. Returns an error key, or None.
+
+        The connection stays open: the entry created from this flow takes it
+        over, so its setup needs no second handshake.
+        """
         assert self._host is not None
         assert self._port is not None
+        self._async_close_grinder()
+        grinder = MahlkonigGrinder(
+            host=self._host,
+            port=self._port,
+            password=password,
+            session=async_get_fleet(self.hass).async_get_session(),
+        )
         try:
-            async with Grinder(
-                host=self._host,
-                port=self._port,
-                password=password,
-                session=async_get_clientsession(self.hass),
-            ):
-                pass
+            async with asyncio.timeout(CONNECT_TIMEOUT.total_seconds()):
+                await grinder.connect()
+                await grinder.request_machine_info()
         except MahlkoenigAuthenticationError:
+            await grinder.close()
             return "invalid_auth"
-        except MahlkoenigConnectionError:
+        except (MahlkoenigConnectionError, asyncio.TimeoutError):
+            await grinder.close()
             return "cannot_connect"
+        self._grinder = grinder
         return None
 
+    def _create_entry(self, title: str, password: str) -> ConfigFlowResult:
+        """Create the entry and hand the open connection over to it.
+
+        The device info goes into the entry data, so setup can create the
+        entities right away.
+        """
+        assert self._host is not None
+        assert self._port is not None
+        assert self._grinder is not None
+        data: dict[str, Any] = {
+            CONF_HOST: self._host,
+            CONF_PORT: self._port,
+            CONF_PASSWORD: password,
+        }
+        if (info := self._grinder.machine_info) is not None:
+            data[CONF_SERIAL_NO] = info.serial_no
+            data[CONF_SW_VERSION] = info.sw_version
+            data[CONF_PRODUCT_NO] = info.product_no
+        async_get_fleet(self.hass).async_hand_over(
+            self._host, self._port, password, self._grinder
+        )
+        self._grinder = None
+        return self.async_create_entry(title=title, data=data)
+
+    @callback
+    def _async_close_grinder(self) -> None:
+        if self._grinder is not None:
+            self.hass.async_create_task(self._grinder.close())
+            self._grinder = None
+
+    @callback
+    def async_remove(self) -> None:
+        """Close a connection no entry took over."""
+        self._async_close_grinder()
+
     async def async_step_zeroconf(
         self, discovery_info: ZeroconfServiceInfo
     ) -> ConfigFlowResult:
@@ -116,12 +202,23 @@ class MahlkonigConfigFlow(ConfigFlow, domain=DOMAIN):
         # Use serial number as unique_id if available
         if self._serial_number:
             await self.async_set_unique_id(self._serial_number)
+            self._async_wake_configured_entry()
             self._abort_if_unique_id_configured(
                 updates={CONF_HOST: self._host, CONF_PORT: self._port}
             )
 
         return await self.async_step_confirm_discovery()
 
+    @callback
+    def _async_wake_configured_entry(self) -> None:
+        """Let an already set up grinder reconnect now that it announced itself."""
+        assert self.unique_id is not None
+        entry = self.hass.config_entries.async_entry_for_domain_unique_id(
+            DOMAIN, self.unique_id
+        )
+        if entry is not None and entry.state is ConfigEntryState.LOADED:
+            entry.runtime_data.async_wake()
+
     async def async_step_confirm_discovery(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -172,16 +269,25 @@ class MahlkonigConfigFlow(ConfigFlow, domain=DOMAIN):
 
     def _create_discovered_entry(self, password: str) -> ConfigFlowResult:
         """Build the ConfigEntry from the discovered host/port and given password."""
-        assert self._host is not None
-        assert self._port is not None
         title = self.context.get("title_placeholders", {}).get(
             "name", f"Mahlkönig X54 ({self._host})"
         )
-        return self.async_create_entry(
-            title=title,
-            data={
-                CONF_HOST: self._host,
-                CONF_PORT: self._port,
-                CONF_PASSWORD: password,
-            },
+        return self._create_entry(title, password)
+
+
+class MahlkonigOptionsFlow(OptionsFlow):
+    """Handle the options of a Mahlkönig X54."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=self.add_suggested_values_to_schema(
+                OPTIONS_SCHEMA, self.config_entry.options
+            ),
         )
@@ -3,6 +3,15 @@
 from homeassistant.const import Platform
 
 DOMAIN = "mahlkoenig"  # has to be the same as parent directory name and match the name in manifest.json
+CONF_GRIND_TIMER_RATE = "grind_timer_rate"
+CONF_PRODUCT_NO = "product_no"
+CONF_SERIAL_NO = "serial_no"
+CONF_SW_VERSION = "sw_version"
+CONF_IMPORT_STATISTICS = "import_statistics"
+DEFAULT_GRIND_TIMER_RATE = 1.0  # state writes per second
+EVENT_GRIND_STARTED = f"{DOMAIN}_grind_started"
+EVENT_GRIND_FINISHED = f"{DOMAIN}_grind_finished"
+
 PLATFORMS = [
     Platform.SENSOR,
     Platform.SELECT,
@@ -2,32 +2,116 @@
 
 import asyncio
 import logging
+import socket
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
 from datetime import datetime, timedelta
+from time import monotonic
 
+import aiohttp
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
-from mahlkoenig import Grinder
 from mahlkoenig.exceptions import (
     MahlkoenigAuthenticationError,
     MahlkoenigConnectionError,
     MahlkoenigProtocolError,
 )
+from mahlkoenig.models import MachineInfoMessage, SystemStatusMessage
+
+from .breaker import BreakerState, CircuitBreaker
+from .const import (
+    CONF_PRODUCT_NO,
+    CONF_SERIAL_NO,
+    CONF_SW_VERSION,
+    DOMAIN,
+    EVENT_GRIND_FINISHED,
+    EVENT_GRIND_STARTED,
+)
+from .fleet import MahlkonigFleet
+from .grind import GrindFinished, GrindTracker, ShotDurations, shot_slot
+from .grinder import MahlkonigGrinder
+from .metrics import GrinderMetrics
+from .recipes import RecipeAttributeCache, RecipeIndex
+from .scheduler import Resource, ResourcePolicy, ResourceScheduler
+from .snapshot import GrinderSnapshot
+from .store import VOLATILE_KEYS, SnapshotStore
+from .usage import RATE_RESOLUTION, UsageRates
 
 _LOGGER = logging.getLogger(__name__)
 
-CONF_SERIAL_NO = "serial_no"
-CONF_SW_VERSION = "sw_version"
-CONF_PRODUCT_NO = "product_no"
+# Ticks run every 10 s. While the grinder is asleep the circuit breaker spaces
+# out reconnects instead.
+IDLE_UPDATE_INTERVAL = timedelta(seconds=10)
+
+# While a shot is running the system status is sampled twice a second by a
+# loop of its own (see `_async_sample`). Home Assistant schedules coordinator
+# refreshes at whole seconds plus a random fraction, so a shorter
+# `update_interval` would fire back to back instead of at this rate.
+GRINDING_SAMPLE_INTERVAL = timedelta(milliseconds=500)
+
+# After a shot or a menu change someone is at the grinder and likely to grind
+# (again) soon, so the status is sampled at the grinding rate for a while to
+# catch the start of the next shot.
+FAST_POLL_WINDOW = timedelta(seconds=30)
+
+# Consecutive failed connects before the breaker opens, and the bounds of the
+# exponential delay between probes while it is open. A waking grinder announces
+# itself via mDNS (see `async_wake`), so probes can be far apart.
+BREAKER_FAILURE_THRESHOLD = 2
+BREAKER_MAX_PROBE_DELAY = timedelta(minutes=30)
+
+# Probes of an open breaker give up much sooner than a regular connect.
+UPDATE_TIMEOUT = timedelta(seconds=10)
+PROBE_TIMEOUT = timedelta(seconds=2)
+
+# A grinder on the LAN accepts a TCP connection within a few milliseconds, so
+# the WebSocket handshake is only attempted once the port has answered.
+TCP_PROBE_TIMEOUT = timedelta(milliseconds=250)
+
+# Recipes are refetched on evidence of an edit (see `_note_recipe_evidence`);
+# the interval is only a safety net.
+RECIPE_SAFETY_INTERVAL = timedelta(hours=6)
+
+# Statistics only change when a shot is ground, so they are fetched shortly
+# after each one (giving the grinder time to update its counters) and
+# otherwise only as a safety net.
+STATISTICS_SETTLE_DELAY = timedelta(seconds=2)
+STATISTICS_SAFETY_INTERVAL = timedelta(hours=1)
+
+RESOURCE_POLICIES = {
+    Resource.SYSTEM_STATUS: ResourcePolicy(ttl=timedelta(0), priority=0),
+    Resource.MACHINE_INFO: ResourcePolicy(ttl=IDLE_UPDATE_INTERVAL, priority=1),
+    Resource.AUTO_SLEEP_TIME: ResourcePolicy(ttl=timedelta(minutes=1), priority=2),
+    Resource.RECIPES: ResourcePolicy(ttl=RECIPE_SAFETY_INTERVAL, priority=3),
+    Resource.WIFI_INFO: ResourcePolicy(ttl=timedelta(minutes=1), priority=4),
+    Resource.STATISTICS: ResourcePolicy(ttl=STATISTICS_SAFETY_INTERVAL, priority=5),
+}
+
+# Resources still due once a tick has spent this long fetching are left for
+# the next tick, so a slow network can't push a tick into the hard timeout.
+TICK_BUDGET = timedelta(seconds=5)
+
+PUSHED_RESOURCES = {
+    MachineInfoMessage: Resource.MACHINE_INFO,
+    SystemStatusMessage: Resource.SYSTEM_STATUS,
+}
 
 type MahlkonigConfigEntry = ConfigEntry["MahlkonigUpdateCoordinator"]
 
 
-class MahlkonigUpdateCoordinator(DataUpdateCoordinator[None]):
-    """Coordinator to fetch all relevant data from the grinder."""
+class MahlkonigUpdateCoordinator(DataUpdateCoordinator[GrinderSnapshot]):
+    """Coordinator to fetch all relevant data from the grinder.
+
+    Listeners subscribe with a set of snapshot keys as their context and are
+    only called back when one of those keys changed since the last update.
+    Listeners without a context are always called.
+    """
 
     def __init__(
         self,
@@ -36,39 +120,131 @@ class MahlkonigUpdateCoordinator(DataUpdateCoordinator[None]):
         host: str,
         port: int,
         password: str,
+        fleet: MahlkonigFleet,
     ):
         """Initialize the coordinator."""
         super().__init__(
             hass,
             _LOGGER,
             name=self.__class__.__name__,
-            update_interval=timedelta(seconds=10),
+            update_interval=IDLE_UPDATE_INTERVAL,
+            always_update=False,
         )
-        session = async_get_clientsession(hass)
+        session = fleet.async_get_session()
 
         self._entry = entry
-        self._grinder = Grinder(host=host, port=port, password=password, session=session)
-
-        self._last_recipe_update = datetime.min
-        self._last_statistics_update = datetime.min
-        self._last_wifi_info_update = datetime.min
-        self._last_auto_sleep_update = datetime.min
+        self._fleet = fleet
+        self._host = host
+        self._port = port
+        # A config flow that just created this entry may leave its connection.
+        grinder = fleet.async_take_over(host, port, password)
+        if grinder is None:
+            grinder = MahlkonigGrinder(
+                host=host, port=port, password=password, session=session
+            )
+        self._grinder = grinder
+
+        # Monotonic arrival time of the last unsolicited frame per resource.
+        # While the grinder keeps pushing a resource we don't poll for it.
+        self._last_pushed: dict[Resource, float] = {}
+
+        self._breaker = CircuitBreaker(
+            failure_threshold=BREAKER_FAILURE_THRESHOLD,
+            base_delay=IDLE_UPDATE_INTERVAL,
+            max_delay=BREAKER_MAX_PROBE_DELAY,
+        )
 
-        self._recipe_update_interval = timedelta(minutes=1)
-        self._statistics_update_interval = timedelta(minutes=5)
-        self._wifi_info_update_interval = timedelta(minutes=1)
-        self._auto_sleep_update_interval = timedelta(minutes=1)
+        # State of the previous run, until the grinder has sent it again.
+        self._store = SnapshotStore(hass, entry.entry_id)
+        self._stored: GrinderSnapshot | None = None
+        self._recipe_attributes = RecipeAttributeCache()
+        self._recipe_index = RecipeIndex()
+        # Active menu and error code of the last system status seen.
+        self._menu_state: tuple[int, str] | None = None
+        self._grind_tracker = GrindTracker()
+        self._shot_durations = ShotDurations()
+        self._usage = UsageRates()
+        entry.async_on_unload(
+            async_track_time_interval(hass, self._async_refresh_usage, RATE_RESOLUTION)
+        )
+        self._fast_poll_until = 0.0
+        self._sampler: asyncio.Task[None] | None = None
+        self._cancel_statistics_refresh: Callable[[], None] | None = None
+        entry.async_on_unload(self._async_cancel_statistics_refresh)
+
+        # What the listeners were last notified about, to diff against.
+        self._published: GrinderSnapshot | None = None
+        self._published_success = True
+
+        self._metrics = GrinderMetrics()
+        self._scheduler = ResourceScheduler(RESOURCE_POLICIES)
+        if self._grinder.machine_info is not None:
+            # Handed over by the config flow, which fetched it moments ago.
+            self._scheduler.complete(Resource.MACHINE_INFO)
+        self._requests: dict[Resource, Callable[[], Awaitable[object]]] = {
+            Resource.MACHINE_INFO: self._grinder.request_machine_info,
+            Resource.SYSTEM_STATUS: self._grinder.request_system_status,
+            Resource.AUTO_SLEEP_TIME: self._grinder.request_auto_sleep_time,
+            Resource.RECIPES: self._grinder.request_recipe_list,
+            Resource.STATISTICS: self._grinder.request_statistics,
+            Resource.WIFI_INFO: self._grinder.request_wifi_info,
+        }
 
     @property
-    def grinder(self) -> Grinder:
+    def grinder(self) -> MahlkonigGrinder:
         """Return the grinder client."""
         return self._grinder
 
+    @property
+    def breaker(self) -> CircuitBreaker:
+        """Return the connection circuit breaker."""
+        return self._breaker
+
+    @property
+    def metrics(self) -> GrinderMetrics:
+        """Return the request and connection metrics."""
+        return self._metrics
+
     @property
     def available(self) -> bool:
         """Return True if the grinder is currently connected."""
         return self._grinder.connected
 
+    @callback
+    def async_wake(self) -> None:
+        """Reconnect right away; the grinder just announced itself via mDNS."""
+        if self._grinder.connected:
+            return
+        _LOGGER.debug("Grinder announced itself, reconnecting")
+        self._breaker.reset()
+        self._entry.async_create_background_task(
+            self.hass, self.async_request_refresh(), name=f"{self.name} wake"
+        )
+
+    async def async_shutdown(self) -> None:
+        """Cancel the refresh timers and write the pending state to disk."""
+        await super().async_shutdown()
+        await self._store.async_flush()
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Call the listeners whose snapshot keys changed since the last call."""
+        if self.data is None or self.last_update_success != self._published_success:
+            changed = None
+        else:
+            changed = self.data.changed_keys(self._published)
+        self._published = self.data
+        self._published_success = self.last_update_success
+
+        if self.data is not None and (changed is None or changed - VOLATILE_KEYS):
+            self._store.async_schedule_save(
+                self.data, self._shot_durations, self._usage
+            )
+
+        for update_callback, context in list(self._listeners.values()):
+            if changed is None or context is None or not changed.isdisjoint(context):
+                update_callback()
+
     @property
     def serial_no(self) -> str | None:
         """Serial number — live machine_info preferred, fallback to entry.data."""
@@ -93,6 +269,11 @@ class MahlkonigUpdateCoordinator(DataUpdateCoordinator[None]):
             return info.product_no
         return self._entry.data.get(CONF_PRODUCT_NO)
 
+    @property
+    def has_stored_state(self) -> bool:
+        """Return True if the state of a previous run was loaded."""
+        return self._stored is not None
+
     @property
     def has_device_info(self) -> bool:
         """Return True if we have at least a serial number for entity setup."""
@@ -112,99 +293,496 @@ class MahlkonigUpdateCoordinator(DataUpdateCoordinator[None]):
         if new_data != dict(self._entry.data):
             self.hass.config_entries.async_update_entry(self._entry, data=new_data)
 
-    async def _async_setup(self):
-        """Set up the coordinator.
+    def _snapshot(self) -> GrinderSnapshot:
+        """Capture the current state for the entities."""
+        return GrinderSnapshot.from_grinder(
+            self._grinder,
+            self._breaker,
+            self._metrics,
+            self._stored,
+            self._recipe_attributes,
+            self._shot_durations.stats,
+            self._usage.stats,
+        )
+
+    def _next_update_interval(self) -> timedelta:
+        """Pick the poll interval from the circuit breaker state.
+
+        Regular ticks land on this entry's stagger slot; probes of an open
+        breaker are jittered already.
+        """
+        if self._breaker.state is BreakerState.OPEN:
+            return timedelta(seconds=max(self._breaker.seconds_until_probe(), 1))
+        return self._fleet.align(self._entry.entry_id, IDLE_UPDATE_INTERVAL)
+
+    def _is_pushed(self, resource: Resource, within: timedelta | None = None) -> bool:
+        """Return True if the grinder pushed this resource within `within`.
+
+        Defaults to one poll interval.
+        """
+        last = self._last_pushed.get(resource)
+        if (within := within or self.update_interval) is None or last is None:
+            return False
+        return monotonic() - last < within.total_seconds()
+
+    @property
+    def _sampling(self) -> bool:
+        """Return True while the system status should be sampled fast."""
+        if not self._grinder.connected:
+            return False
+        status = self._grinder.system_status
+        if status is not None and status.grind_running:
+            return True
+        return monotonic() < self._fast_poll_until
+
+    @callback
+    def _async_start_sampler(self) -> None:
+        """Start sampling the system status if a shot is running or likely."""
+        if not self._sampling or (
+            self._sampler is not None and not self._sampler.done()
+        ):
+            return
+        self._sampler = self._entry.async_create_background_task(
+            self.hass, self._async_sample(), name=f"{self.name} status sampler"
+        )
+
+    async def _async_sample(self) -> None:
+        """Sample the system status every `GRINDING_SAMPLE_INTERVAL`.
+
+        Runs until the shot has stopped and the fast poll window is over, and
+        gives up on the first failed request; the next tick restarts it if
+        the grinder is still busy. Samples the grinder pushed on its own are
+        not requested again.
+        """
+        interval = GRINDING_SAMPLE_INTERVAL.total_seconds()
+        elapsed = 0.0
+        while True:
+            await asyncio.sleep(max(interval - elapsed, 0))
+            if not self._sampling:
+                return
+            start = monotonic()
+            if not self._is_pushed(Resource.SYSTEM_STATUS, GRINDING_SAMPLE_INTERVAL):
+                try:
+                    async with (
+                        self._fleet.limit(),
+                        asyncio.timeout(UPDATE_TIMEOUT.total_seconds()),
+                    ):
+                        await self._async_request(Resource.SYSTEM_STATUS)
+                except (
+                    MahlkoenigConnectionError,
+                    MahlkoenigProtocolError,
+                    aiohttp.ClientConnectionResetError,
+                    RuntimeError,
+                    asyncio.TimeoutError,
+                ) as err:
+                    # A socket closing under the send surfaces as a RuntimeError.
+                    _LOGGER.debug("Sampling the system status failed: %s", err)
+                    if isinstance(err, asyncio.TimeoutError):
+                        self._metrics.timeouts += 1
+                    return
+                self._note_recipe_evidence()
+                self._observe_grind()
+                self.async_publish()
+            elapsed = monotonic() - start
+
+    async def _async_listen(self) -> None:
+        """Publish unsolicited grinder frames to the entities as they arrive."""
+        while True:
+            message = await self._grinder.next_pushed()
+            # A single pushed recipe doesn't stand in for the whole list.
+            if (resource := PUSHED_RESOURCES.get(type(message))) is not None:
+                self._last_pushed[resource] = monotonic()
+            self._async_handle_push()
+
+    @callback
+    def _async_handle_push(self) -> None:
+        """Publish pushed state.
+
+        Unlike `async_set_updated_data` this does not reschedule the refresh
+        timer, so a chatty grinder can't starve the fallback poll of the
+        resources it never pushes (statistics, recipes, wifi, auto-sleep).
+        """
+        self._persist_machine_info()
+        self._note_recipe_evidence()
+        self._observe_grind()
+        self.async_publish()
+        self._async_start_sampler()
+
+    @callback
+    def async_publish(self) -> None:
+        """Notify the listeners if the snapshot changed.
+
+        For state the grinder client already applied, e.g. from the response
+        to a setting, which needs no read-back.
+        """
+        snapshot = self._snapshot()
+        if snapshot != self.data:
+            self.data = snapshot
+            self.async_update_listeners()
+
+    @callback
+    def _async_refresh_usage(self, now: datetime) -> None:
+        """Let the hourly rate decay and reset the daily totals at midnight."""
+        self._usage.refresh(now)
+        self.async_publish()
+
+    def _note_recipe_evidence(self) -> None:
+        """Make the recipe list due if there are signs a recipe was edited.
+
+        Signs are a system status change other than the grind timer (someone
+        is using the grinder's menu) and recipes the grinder sent on its own
+        that disagree with the index.
+        """
+        status = self._grinder.system_status
+        menu_state = (
+            None if status is None else (status.active_menu, status.error_code)
+        )
+        menu_changed = None not in (self._menu_state, menu_state) and (
+            menu_state != self._menu_state
+        )
+        self._menu_state = menu_state
+        if menu_changed:
+            self._fast_poll_until = monotonic() + FAST_POLL_WINDOW.total_seconds()
+        if menu_changed or self._recipe_index.is_skewed(self._grinder.recipes):
+            self._scheduler.mark_due(Resource.RECIPES)
+
+    @callback
+    def _observe_grind(self) -> None:
+        """Fire grind events and schedule follow-ups for shot transitions."""
+        transition = self._grind_tracker.observe(self._grinder.system_status)
+        if transition is None:
+            return
+        device = dr.async_get(self.hass).async_get_device(
+            identifiers={(DOMAIN, self.serial_no)}
+        )
+        recipe = self._grinder.recipes.get(transition.active_menu)
+        event_data = {
+            "device_id": device.id if device is not None else None,
+            "serial_no": self.serial_no,
+            "active_menu": transition.active_menu,
+            "recipe_name": recipe.name if recipe is not None else None,
+            "started_at": transition.started_at.isoformat(),
+        }
+        if not isinstance(transition, GrindFinished):
+            self.hass.bus.async_fire(EVENT_GRIND_STARTED, event_data)
+            return
 
-        Tries to populate cached state by talking to the grinder. If the grinder
-        is offline and we already have device metadata in entry.data from a
-        previous successful connect, we let setup succeed and rely on the
-        background poll loop to reconnect later.
+        self.hass.bus.async_fire(
+            EVENT_GRIND_FINISHED,
+            {
+                **event_data,
+                "finished_at": transition.finished_at.isoformat(),
+                "duration": transition.duration.total_seconds(),
+            },
+        )
+        self._shot_durations.record(
+            shot_slot(transition.active_menu), transition.duration
+        )
+        self._fast_poll_until = monotonic() + FAST_POLL_WINDOW.total_seconds()
+        # Give the grinder a moment to update its counters.
+        self._async_cancel_statistics_refresh()
+        self._cancel_statistics_refresh = async_call_later(
+            self.hass, STATISTICS_SETTLE_DELAY, self._async_refresh_statistics
+        )
+
+    async def _async_refresh_statistics(self, _now: datetime) -> None:
+        """Fetch the statistics of the shot that just finished."""
+        self._cancel_statistics_refresh = None
+        await self.async_refresh_resource(Resource.STATISTICS)
+
+    @callback
+    def _async_cancel_statistics_refresh(self) -> None:
+        if self._cancel_statistics_refresh is not None:
+            self._cancel_statistics_refresh()
+            self._cancel_statistics_refresh = None
+
+    async def async_refresh_recipes(self) -> bool:
+        """Refetch the recipe list now; see `async_refresh_resource`."""
+        return await self.async_refresh_resource(Resource.RECIPES)
+
+    async def async_refresh_resource(self, resource: Resource) -> bool:
+        """Fetch a single resource now and publish it.
+
+        Unlike a full refresh this costs one round trip, leaves the other
+        resources and the poll timer alone, and only notifies the listeners
+        of what changed. A grinder that isn't connected gets a regular
+        refresh with the resource due instead, and a failed fetch leaves it
+        due for the next tick. Failures are only logged and counted: this
+        also runs from timers, e.g. the statistics fetch after a shot.
+
+        Returns False if the grinder was connected but the fetch failed.
         """
+        self._scheduler.mark_due(resource)
+        if not self._grinder.connected:
+            await self.async_request_refresh()
+            return True
+
         try:
-            async with asyncio.timeout(10):
+            async with (
+                self._fleet.limit(),
+                asyncio.timeout(UPDATE_TIMEOUT.total_seconds()),
+            ):
+                await self._async_request(resource)
+        except asyncio.TimeoutError:
+            _LOGGER.debug("Refreshing %s timed out", resource)
+            self._metrics.timeouts += 1
+            return False
+        except MahlkoenigProtocolError as err:
+            _LOGGER.debug("Unknown message refreshing %s: %s", resource, err)
+            self._metrics.protocol_errors += 1
+            return False
+        except Exception:
+            # A lost connection, an HTTP error or unparsable body from the
+            # statistics endpoint, or a socket closing under the request.
+            _LOGGER.debug("Refreshing %s failed", resource, exc_info=True)
+            self._metrics.request_failures += 1
+            return False
+        self._complete(resource)
+        self.async_publish()
+        return True
+
+    async def _async_fetch_due(self) -> None:
+        """Fetch every due resource in one concurrent wave.
+
+        The requests share the single WebSocket and are correlated by message
+        id, so a wave costs roughly one round trip instead of one per resource.
+        Requests still outstanding when the tick budget runs out are cancelled
+        and left for the next tick.
+        """
+        self._note_recipe_evidence()
+        wave: list[Resource] = []
+        for resource in self._scheduler.pop_due():
+            if self._is_pushed(resource):
+                self._scheduler.complete(resource)
+            else:
+                wave.append(resource)
+        if not wave:
+            return
+
+        _LOGGER.debug("fetching %s", ", ".join(wave))
+        tasks = {
+            resource: asyncio.create_task(self._async_request(resource))
+            for resource in wave
+        }
+        try:
+            await asyncio.wait(tasks.values(), timeout=TICK_BUDGET.total_seconds())
+        finally:
+            for resource, task in tasks.items():
+                if task.done() and not task.cancelled() and task.exception() is None:
+                    self._complete(resource)
+                else:
+                    task.cancel()
+                    self._scheduler.requeue(resource)
+
+        for resource, task in tasks.items():
+            if task.done() and not task.cancelled() and (err := task.exception()):
+                raise err
+            if not task.done():
+                _LOGGER.debug("tick budget spent, deferring %s", resource)
+
+    def _complete(self, resource: Resource) -> None:
+        """Book a successful fetch of `resource`."""
+        self._scheduler.complete(resource)
+        if resource is Resource.RECIPES:
+            self._index_recipes()
+        elif resource is Resource.STATISTICS:
+            self._record_usage()
+
+    def _index_recipes(self) -> None:
+        """Record a freshly fetched recipe list in the index."""
+        if changed := self._recipe_index.record(self._grinder.recipes):
+            _LOGGER.debug(
+                "recipes changed in slots %s", ", ".join(map(str, sorted(changed)))
+            )
+
+    def _record_usage(self) -> None:
+        """Add freshly fetched statistics to the usage windows."""
+        if (statistics := self._grinder.statistics) is not None:
+            self._usage.record(dt_util.utcnow(), statistics)
+
+    async def _async_request(self, resource: Resource) -> None:
+        """Request one resource and record its round trip."""
+        start = monotonic()
+        await self._requests[resource]()
+        self._metrics.record_request(resource, monotonic() - start)
+
+    async def _async_port_open(self) -> bool:
+        """Return True if the grinder accepts a plain TCP connection.
+
+        Name resolution isn't covered by the short timeout, since resolving a
+        `.local` name can legitimately take longer than the connect itself.
+        The fleet's resolver keeps the address for the WebSocket connect, and
+        forgets it when the port doesn't answer, in case the grinder moved.
+        """
+        resolver = self._fleet.resolver
+        try:
+            infos = await resolver.resolve(self._host, self._port, socket.AF_UNSPEC)
+            async with asyncio.timeout(TCP_PROBE_TIMEOUT.total_seconds()):
+                _, writer = await asyncio.open_connection(
+                    infos[0]["host"], self._port, family=infos[0]["family"]
+                )
+        except (OSError, IndexError, asyncio.TimeoutError):
+            resolver.forget(self._host)
+            return False
+        writer.close()
+        with suppress(OSError):
+            await writer.wait_closed()
+        return True
+
+    async def _async_connect(self, timeout: timedelta) -> None:
+        """Connect and authenticate, unless the grinder's port is closed."""
+        self._last_pushed.clear()
+        start = monotonic()
+        success = False
+        try:
+            if not await self._async_port_open():
+                raise MahlkoenigConnectionError(
+                    f"{self._host}:{self._port} is not accepting connections"
+                )
+            async with asyncio.timeout(timeout.total_seconds()):
                 await self._grinder.connect()
+            success = True
+            # Recipes edited while we were disconnected leave no other trace,
+            # and the end of a shot we lost track of wouldn't be noticed.
+            self._scheduler.mark_due(Resource.RECIPES)
+            self._scheduler.mark_due(Resource.STATISTICS)
+            self._grind_tracker.reset()
+        finally:
+            self._metrics.record_connect(monotonic() - start, success)
+
+    async def async_config_entry_first_refresh(self) -> None:
+        """Refresh data for the first time when a config entry is set up.
+
+        With device metadata in entry.data from a previous successful connect
+        the entities can be created right away, so the initial sync runs in a
+        background task and a grinder asleep at boot doesn't delay startup.
+        Only a grinder that has never been seen must answer during setup.
+        """
+        if not self.has_device_info:
+            await super().async_config_entry_first_refresh()
+            return
+
+        await self._async_setup()
+        self.data = self._snapshot()
+        self._entry.async_create_background_task(
+            self.hass, self._async_initial_sync(), name=f"{self.name} initial sync"
+        )
 
-                await self._grinder.request_machine_info()
-                await self._grinder.request_wifi_info()
-                await self._grinder.request_system_status()
-                await self._grinder.request_auto_sleep_time()
-                await self._grinder.request_recipe_list()
-                await self._grinder.request_statistics()
+    async def _async_initial_sync(self) -> None:
+        """Run the first refresh of a grinder whose entities already exist."""
+        # Spread the first refresh of entries set up together.
+        await asyncio.sleep(self._fleet.startup_jitter())
+        await self.async_refresh()
 
-                self._persist_machine_info()
+    async def _async_setup(self):
+        """Set up the coordinator.
+
+        Loads the state stored by the previous run and starts listening for
+        pushed frames. Without device metadata in entry.data the grinder is
+        asked for it here, and setup fails with `ConfigEntryNotReady` while it
+        can't be reached.
+        """
+        if (stored := await self._store.async_load()) is not None:
+            self._stored = stored.snapshot
+            self._shot_durations.load(stored.shot_durations)
+            self._usage.load(stored.usage)
+        self._entry.async_create_background_task(
+            self.hass, self._async_listen(), name=f"{self.name} push listener"
+        )
+        if self.has_device_info:
+            return
 
-                now = datetime.now()
-                self._last_recipe_update = now
-                self._last_statistics_update = now
-                self._last_wifi_info_update = now
-                self._last_auto_sleep_update = now
+        # Spread the first refresh of entries set up together.
+        await asyncio.sleep(self._fleet.startup_jitter())
+
+        try:
+            async with (
+                self._fleet.limit(),
+                asyncio.timeout(UPDATE_TIMEOUT.total_seconds()),
+            ):
+                await self._async_connect(UPDATE_TIMEOUT)
+                await self._async_fetch_due()
+
+                self._persist_machine_info()
+                self._observe_grind()
 
         except MahlkoenigAuthenticationError as err:
+            self._metrics.auth_failures += 1
             raise ConfigEntryAuthFailed from err
         except (MahlkoenigConnectionError, asyncio.TimeoutError) as err:
+            if isinstance(err, asyncio.TimeoutError):
+                self._metrics.timeouts += 1
             await self._grinder.close()
-            if self.has_device_info:
-                _LOGGER.debug(
-                    "Grinder offline at setup; entities will use cached data: %s",
-                    err,
-                )
-                return
+            self._breaker.record_failure()
             raise ConfigEntryNotReady("Cannot connect to grinder") from err
+        self._async_start_sampler()
 
-    async def _async_update_data(self) -> None:
+    async def _async_update_data(self) -> GrinderSnapshot:
         """Fetch the latest data from the grinder.
 
         Connection failures are expected (the grinder sleeps when not in use)
         and are handled silently — the coordinator stays in a successful state
-        and entities keep their last value.
+        and entities keep their last value. While the circuit breaker is open
+        no connect is attempted at all; once a probe is due a single connect
+        with a short timeout decides whether it closes again.
         """
+        if not self._grinder.connected and not self._breaker.allow_request():
+            _LOGGER.debug(
+                "Circuit open; next probe in %.0f s",
+                self._breaker.seconds_until_probe(),
+            )
+            self.update_interval = self._next_update_interval()
+            return self._snapshot()
+
+        connect_timeout = (
+            PROBE_TIMEOUT
+            if self._breaker.state is BreakerState.HALF_OPEN
+            else UPDATE_TIMEOUT
+        )
+        start = monotonic()
         try:
-            async with asyncio.timeout(10):
+            async with (
+                self._fleet.limit(),
+                asyncio.timeout(UPDATE_TIMEOUT.total_seconds()),
+            ):
                 if not self._grinder.connected:
-                    await self._grinder.connect()
-                await self._grinder.request_machine_info()
-                await self._grinder.request_system_status()
+                    await self._async_connect(connect_timeout)
+                await self._async_fetch_due()
 
                 self._persist_machine_info()
-
-                now = datetime.now()
-                if (
-                    now - self._last_auto_sleep_update
-                ) >= self._auto_sleep_update_interval:
-                    _LOGGER.debug("fetching auto sleep time")
-                    await self._grinder.request_auto_sleep_time()
-                    self._last_auto_sleep_update = now
-
-                if (now - self._last_recipe_update) >= self._recipe_update_interval:
-                    _LOGGER.debug("fetching recipe_updates")
-                    await self._grinder.request_recipe_list()
-                    self._last_recipe_update = now
-
-                if (
-                    now - self._last_statistics_update
-                ) >= self._statistics_update_interval:
-                    _LOGGER.debug("fetching statistics")
-                    await self._grinder.request_statistics()
-                    self._last_statistics_update = now
-
-                if (
-                    now - self._last_wifi_info_update
-                ) >= self._wifi_info_update_interval:
-                    _LOGGER.debug("fetching wifi settings")
-                    await self._grinder.request_wifi_info()
-                    self._last_wifi_info_update = now
+                self._observe_grind()
 
         except MahlkoenigAuthenticationError as err:
+            self._metrics.auth_failures += 1
             raise ConfigEntryAuthFailed from err
         except (MahlkoenigConnectionError, asyncio.TimeoutError) as err:
-            # Expected — grinder is asleep. Keep last-known state, no warnings.
-            _LOGGER.debug("Grinder unreachable: %s", err)
-            await self._grinder.close()
+            if isinstance(err, asyncio.TimeoutError):
+                self._metrics.timeouts += 1
+            if isinstance(err, asyncio.TimeoutError) and self._grinder.connected:
+                # The heartbeat keeps a live socket open, so the grinder was
+                # merely slow. Keep the connection for the next tick.
+                _LOGGER.debug("Grinder slow to respond, keeping the connection")
+            else:
+                # Expected — grinder is asleep. Keep last-known state, no warnings.
+                _LOGGER.debug("Grinder unreachable: %s", err)
+                await self._grinder.close()
+                self._breaker.record_failure()
         except MahlkoenigProtocolError as err:
+            self._metrics.protocol_errors += 1
             raise UpdateFailed("Unknown message from grinder") from err
         except Exception as err:
             _LOGGER.debug("Unknown grinder error", exc_info=True)
             await self._grinder.close()
+            # Counted like a failed connect, so a half-open probe reopens.
+            self._breaker.record_failure()
             raise UpdateFailed("Unknown grinder error") from err
-
-        return None
+        else:
+            self._breaker.record_success()
+            self._async_start_sampler()
+        finally:
+            self._metrics.record_tick(
+                monotonic() - start, TICK_BUDGET.total_seconds()
+            )
+            self.update_interval = self._next_update_interval()
+
+        return self._snapshot()
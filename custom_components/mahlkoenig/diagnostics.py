@@ -0,0 +1,29 @@
+"""Diagnostics support for Mahlkönig X54."""
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.const import CONF_PASSWORD
+from homeassistant.core import HomeAssistant
+
+from .coordinator import MahlkonigConfigEntry
+
+TO_REDACT = {CONF_PASSWORD}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: MahlkonigConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = entry.runtime_data
+    breaker = coordinator.breaker
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "connected": coordinator.available,
+        "update_interval": coordinator.update_interval,
+        "breaker": {
+            "state": breaker.state,
+            "next_probe": breaker.next_probe,
+        },
+        "metrics": coordinator.metrics.as_dict(),
+    }
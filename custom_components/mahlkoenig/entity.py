@@ -1,11 +1,14 @@
 """Base class for Mahlkonig entities."""
 
+from collections.abc import Iterable
+
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import EntityDescription
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import MahlkonigUpdateCoordinator
+from .snapshot import CONNECTED
 
 
 class MahlkonigEntity[T](CoordinatorEntity[MahlkonigUpdateCoordinator]):
@@ -17,9 +20,17 @@ class MahlkonigEntity[T](CoordinatorEntity[MahlkonigUpdateCoordinator]):
         self,
         coordinator: MahlkonigUpdateCoordinator,
         entity_description: EntityDescription,
+        snapshot_keys: Iterable[str] = (),
     ) -> None:
-        """Initialize the entity."""
-        super().__init__(coordinator)
+        """Initialize the entity.
+
+        `snapshot_keys` names the parts of the coordinator snapshot the entity
+        reads; it is only updated when one of them changes. Availability
+        follows the connection, so `CONNECTED` is always included.
+        """
+        super().__init__(
+            coordinator, context=frozenset({CONNECTED, *snapshot_keys})
+        )
         self.entity_description = entity_description
         self.grinder = coordinator.grinder
 
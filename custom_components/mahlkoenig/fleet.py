@@ -0,0 +1,175 @@
+"""Shared scheduling across all Mahlkönig X54 grinders of one instance."""
+
+import asyncio
+import random
+from datetime import timedelta
+
+import aiohttp
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN
+from .grinder import MahlkonigGrinder
+from .session import GrinderResolver, create_grinder_session
+
+# At most this many grinders connect or run requests at the same time.
+MAX_CONCURRENT_GRINDERS = 8
+
+# Consecutive entries tick this far apart; the pattern repeats every period.
+# Home Assistant schedules coordinator refreshes at whole seconds of the event
+# loop clock, so the step can't be any finer.
+STAGGER_STEP = timedelta(seconds=1)
+STAGGER_PERIOD = timedelta(seconds=10)
+
+# Upper bound of the random delay before an entry's first refresh.
+STARTUP_JITTER = timedelta(seconds=1)
+
+# A connection left by a config flow is closed unless the entry it created
+# takes it over within this window.
+HANDOVER_TTL = timedelta(seconds=60)
+
+DATA_FLEET: HassKey["MahlkonigFleet"] = HassKey(DOMAIN)
+
+
+class MahlkonigFleet:
+    """Spreads the grinders' ticks and caps how many talk to their grinder.
+
+    Without it every config entry runs an independent timer, so after a
+    restart all grinders poll in lockstep bursts. The fleet also owns the
+    client session the grinders share, so their long-lived sockets don't
+    compete with other integrations for Home Assistant's shared session.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize an empty fleet."""
+        self._hass = hass
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_GRINDERS)
+        self._slots: dict[str, int] = {}
+        self.resolver = GrinderResolver(hass)
+        self._session: aiohttp.ClientSession | None = None
+        self._unsub_close: CALLBACK_TYPE | None = None
+        # Connections left by config flows, by host, port and password.
+        self._handovers: dict[
+            tuple[str, int, str], tuple[MahlkonigGrinder, CALLBACK_TYPE]
+        ] = {}
+
+    @callback
+    def async_get_session(self) -> aiohttp.ClientSession:
+        """Return the grinders' client session, creating it if needed."""
+        if self._session is None or self._session.closed:
+            self._session = create_grinder_session(self.resolver)
+            self._unsub_close = self._hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_CLOSE, self._async_close_on_stop
+            )
+        return self._session
+
+    async def _async_close_on_stop(self, _event: Event) -> None:
+        self._unsub_close = None
+        await self.async_close()
+
+    @callback
+    def async_hand_over(
+        self, host: str, port: int, password: str, grinder: MahlkonigGrinder
+    ) -> None:
+        """Keep a connected grinder for the entry about to be set up."""
+        key = (host, port, password)
+        self._async_expire_handover(key)
+        self._handovers[key] = (
+            grinder,
+            async_call_later(
+                self._hass, HANDOVER_TTL, lambda _now: self._async_expire_handover(key)
+            ),
+        )
+
+    @callback
+    def async_take_over(
+        self, host: str, port: int, password: str
+    ) -> MahlkonigGrinder | None:
+        """Return the grinder a config flow left for these settings, if any."""
+        if (handover := self._handovers.pop((host, port, password), None)) is None:
+            return None
+        grinder, cancel_expiry = handover
+        cancel_expiry()
+        if not grinder.connected:
+            self._hass.async_create_task(grinder.close())
+            return None
+        return grinder
+
+    @callback
+    def _async_expire_handover(self, key: tuple[str, int, str]) -> None:
+        if (handover := self._handovers.pop(key, None)) is not None:
+            grinder, cancel_expiry = handover
+            cancel_expiry()
+            self._hass.async_create_task(grinder.close())
+
+    async def async_close(self) -> None:
+        """Close the client session and any connection not taken over."""
+        handovers, self._handovers = self._handovers, {}
+        for grinder, cancel_expiry in handovers.values():
+            cancel_expiry()
+            await grinder.close()
+        if self._unsub_close is not None:
+            self._unsub_close()
+            self._unsub_close = None
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        await self.resolver.close()
+
+    def limit(self) -> asyncio.Semaphore:
+        """Return the budget to hold while connecting or requesting."""
+        return self._semaphore
+
+    @callback
+    def async_register(self, entry_id: str) -> None:
+        """Assign the entry the lowest free stagger slot."""
+        if entry_id in self._slots:
+            return
+        taken = set(self._slots.values())
+        self._slots[entry_id] = next(
+            slot for slot in range(len(taken) + 1) if slot not in taken
+        )
+
+    @callback
+    def async_unregister(self, entry_id: str) -> None:
+        """Release the entry's stagger slot."""
+        self._slots.pop(entry_id, None)
+
+    @property
+    def empty(self) -> bool:
+        """Return True once no entry is registered anymore."""
+        return not self._slots
+
+    def align(self, entry_id: str, interval: timedelta) -> timedelta:
+        """Return `interval` adjusted so the next tick lands on the entry's slot.
+
+        The coordinator's refresh is scheduled at the current whole second of
+        the event loop clock plus the interval, so the interval is stretched
+        or shortened by up to half a period to reach the next second of the
+        entry's slot. Applied on every tick, this keeps the entries apart
+        whatever their ticks cost and however their intervals changed.
+        """
+        period = int(STAGGER_PERIOD.total_seconds())
+        step = int(STAGGER_STEP.total_seconds())
+        slot = self._slots.get(entry_id, 0) * step % period
+        seconds = int(interval.total_seconds())
+        shift = (slot - int(self._hass.loop.time()) - seconds) % period
+        if shift > period // 2:
+            shift -= period
+        return timedelta(seconds=seconds + shift)
+
+    @staticmethod
+    def startup_jitter() -> float:
+        """Return a random delay in seconds before an entry's first refresh."""
+        return random.uniform(0, STARTUP_JITTER.total_seconds())
+
+
+@callback
+def async_get_fleet(hass: HomeAssistant) -> MahlkonigFleet:
+    """Return the fleet of this Home Assistant instance, creating it if needed."""
+    if (fleet := hass.data.get(DATA_FLEET)) is None:
+        fleet = hass.data[DATA_FLEET] = MahlkonigFleet(hass)
+    return fleet
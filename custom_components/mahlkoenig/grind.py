@@ -0,0 +1,202 @@
+"""Grind start/stop detection for Mahlkönig X54."""
+
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from time import monotonic
+from types import MappingProxyType
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+from mahlkoenig.models import SystemStatus
+
+from .grinder import RECIPE_SLOTS
+from .metrics import Histogram
+
+# Shot durations are tracked per recipe slot ("1" to "4") and for everything
+# ground outside a recipe.
+MANUAL = "manual"
+SHOT_SLOTS = (*(str(recipe_no) for recipe_no in range(1, RECIPE_SLOTS + 1)), MANUAL)
+
+# Seconds. Quarter seconds up to 10 s, where single doses are, coarser above.
+SHOT_DURATION_BUCKETS = (
+    *(quarter / 4 for quarter in range(4, 41)),
+    12.0,
+    15.0,
+    20.0,
+    25.0,
+    30.0,
+    45.0,
+    60.0,
+)
+
+
+def shot_slot(active_menu: int) -> str:
+    """Return the shot slot of a grind in `active_menu`."""
+    if 1 <= active_menu <= RECIPE_SLOTS:
+        return str(active_menu)
+    return MANUAL
+
+
+@dataclass(frozen=True, slots=True)
+class GrindStarted:
+    """A shot has started."""
+
+    active_menu: int
+    started_at: datetime
+
+
+@dataclass(frozen=True, slots=True)
+class GrindFinished:
+    """A shot has finished."""
+
+    active_menu: int
+    started_at: datetime
+    finished_at: datetime
+    duration: timedelta
+
+
+class GrindTracker:
+    """Turns system status observations into grind start and finish events.
+
+    Feed it every system status the grinder sends, polled or pushed; the
+    same status object seen twice is not a transition. The duration is the
+    grinder's own grind timer where it reported one, and the time between
+    the observed start and finish otherwise.
+    """
+
+    def __init__(self, clock: Callable[[], float] = monotonic) -> None:
+        """Initialize a tracker that has seen nothing yet."""
+        self._clock = clock
+        self._status: SystemStatus | None = None
+        self._started: GrindStarted | None = None
+        self._started_at_clock = 0.0
+        self._grind_time = timedelta(0)
+
+    @property
+    def running(self) -> bool:
+        """Return True while a shot is in progress."""
+        return self._started is not None
+
+    def reset(self) -> None:
+        """Forget the current shot, e.g. because the connection dropped.
+
+        The last status stays known, so the client's stale copy of it isn't
+        mistaken for news.
+        """
+        self._started = None
+
+    def observe(
+        self, status: SystemStatus | None
+    ) -> GrindStarted | GrindFinished | None:
+        """Return the transition `status` represents, if any."""
+        if status is None or status is self._status:
+            return None
+        self._status = status
+
+        if status.grind_running:
+            if self._started is not None:
+                self._grind_time = max(self._grind_time, status.grind_time)
+                return None
+            self._started = GrindStarted(
+                active_menu=status.active_menu,
+                # The grinder may have been running for a moment already.
+                started_at=dt_util.utcnow() - status.grind_time,
+            )
+            self._started_at_clock = self._clock() - status.grind_time.total_seconds()
+            self._grind_time = status.grind_time
+            return self._started
+
+        if (started := self._started) is None:
+            return None
+        self._started = None
+        duration = max(self._grind_time, status.grind_time)
+        if not duration:
+            duration = timedelta(seconds=self._clock() - self._started_at_clock)
+        return GrindFinished(
+            active_menu=started.active_menu,
+            started_at=started.started_at,
+            finished_at=dt_util.utcnow(),
+            duration=duration,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ShotDurationStats:
+    """Distribution of the shot durations of one slot, in seconds."""
+
+    count: int = 0
+    mean: float | None = None
+    p50: float | None = None
+    p95: float | None = None
+
+    @property
+    def attributes(self) -> dict[str, Any]:
+        """Return the statistics as state attributes."""
+        return {
+            "count": self.count,
+            "mean": _round(self.mean),
+            "p50": _round(self.p50),
+            "p95": _round(self.p95),
+        }
+
+
+def _round(seconds: float | None) -> float | None:
+    return None if seconds is None else round(seconds, 2)
+
+
+class ShotDurations:
+    """Streaming shot duration histograms, one per slot.
+
+    Memory is fixed by the number of buckets, however many shots are ground.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty histograms."""
+        self._histograms = {
+            slot: Histogram(SHOT_DURATION_BUCKETS) for slot in SHOT_SLOTS
+        }
+        self._stats = self._summarize()
+
+    def _summarize(self) -> Mapping[str, ShotDurationStats]:
+        return MappingProxyType(
+            {
+                slot: ShotDurationStats(
+                    count=histogram.count,
+                    mean=histogram.mean,
+                    p50=histogram.quantile(0.5),
+                    p95=histogram.quantile(0.95),
+                )
+                for slot, histogram in self._histograms.items()
+            }
+        )
+
+    @property
+    def stats(self) -> Mapping[str, ShotDurationStats]:
+        """Return the current statistics of every slot."""
+        return self._stats
+
+    def record(self, slot: str, duration: timedelta) -> None:
+        """Add one finished shot."""
+        self._histograms[slot].add(duration.total_seconds())
+        self._stats = self._summarize()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histograms for storage."""
+        return {
+            slot: histogram.as_dict() for slot, histogram in self._histograms.items()
+        }
+
+    def load(self, data: Mapping[str, Any]) -> None:
+        """Restore histograms stored by `as_dict`.
+
+        Histograms stored with other buckets are dropped rather than merged.
+        """
+        for slot, stored in data.items():
+            if (
+                slot in self._histograms
+                and tuple(stored.get("bounds", ())) == SHOT_DURATION_BUCKETS
+            ):
+                self._histograms[slot] = Histogram.from_dict(stored)
+        self._stats = self._summarize()
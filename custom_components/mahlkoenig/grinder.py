@@ -0,0 +1,146 @@
+"""Grinder client for Mahlkönig X54."""
+
+import asyncio
+from datetime import timedelta
+
+import aiohttp
+
+from mahlkoenig import Grinder, Recipe
+from mahlkoenig.exceptions import (
+    MahlkoenigAuthenticationError,
+    MahlkoenigConnectionError,
+    MahlkoenigError,
+)
+from mahlkoenig.models import (
+    MachineInfoMessage,
+    MessageType,
+    RecipeMessage,
+    ResponseMessage,
+    SimpleRequest,
+    SystemStatusMessage,
+)
+
+# Frames the grinder sends on its own, i.e. without a pending request.
+PUSHED_MESSAGE_TYPES = (MachineInfoMessage, SystemStatusMessage, RecipeMessage)
+
+# The X54 has four recipe slots and answers a recipe list request with one
+# frame per slot.
+RECIPE_SLOTS = 4
+
+# The WebSocket is pinged this often; without a pong within half of it the
+# socket is considered dead and closed.
+HEARTBEAT = timedelta(seconds=5)
+
+
+class MahlkonigGrinder(Grinder):
+    """Grinder client that also surfaces unsolicited frames.
+
+    The upstream client only resolves frames that answer one of its own
+    requests. Anything else the grinder sends is applied to the cached state
+    and dropped; here it is additionally queued so the coordinator can react
+    to it without polling.
+
+    The connection is kept alive with WebSocket heartbeats. When the socket
+    dies, the client stops reporting itself connected and fails the requests
+    in flight right away, instead of leaving them to time out.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize the client."""
+        super().__init__(*args, **kwargs)
+        # The payload has already been applied to the cached state when it is
+        # queued, so a small bound is enough; we only need the wake-up.
+        self._pushed: asyncio.Queue[ResponseMessage] = asyncio.Queue(maxsize=16)
+        # Slots received so far, while a recipe list request is in flight.
+        # The replies carry no request id, so only one request may be.
+        self._recipe_list: tuple[asyncio.Future[None], set[int]] | None = None
+        self._recipe_list_lock = asyncio.Lock()
+        # The receive loop reads `self._ws` when it starts, so a second
+        # connect racing the first would leave two loops on one socket.
+        self._connect_lock = asyncio.Lock()
+
+    async def connect(self) -> None:
+        """Open the WebSocket with heartbeats and authenticate (idempotent).
+
+        Concurrent calls are serialized; the later ones find the socket
+        open and logged in.
+        """
+        try:
+            async with self._connect_lock:
+                if self._ws and not self._ws.closed:
+                    return
+                self._ws = await self._session.ws_connect(
+                    self._ws_url, heartbeat=HEARTBEAT.total_seconds()
+                )
+                self._receiver_task = asyncio.create_task(
+                    self._recv_loop(), name="x54-recv"
+                )
+                await self._login()
+        except aiohttp.ClientConnectorError as err:
+            raise MahlkoenigConnectionError(
+                f"Failed to connect to grinder: {err}"
+            ) from err
+        except (
+            asyncio.TimeoutError,
+            aiohttp.SocketTimeoutError,
+            aiohttp.ServerTimeoutError,
+        ) as err:
+            raise MahlkoenigConnectionError("Connection to grinder timed out") from err
+
+    async def _recv_loop(self) -> None:
+        err: MahlkoenigError = MahlkoenigConnectionError("Connection to grinder lost")
+        try:
+            await super()._recv_loop()
+        except MahlkoenigAuthenticationError as auth_err:
+            # A rejected login ends the receive loop; the login fails with it.
+            err = auth_err
+        finally:
+            self._connection_lost(err)
+
+    def _connection_lost(self, err: MahlkoenigError) -> None:
+        """Fail everything that waits on a socket that is gone."""
+        self._connected.clear()
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(err)
+        self._pending.clear()
+        if self._recipe_list is not None and not self._recipe_list[0].done():
+            self._recipe_list[0].set_exception(err)
+
+    async def next_pushed(self) -> ResponseMessage:
+        """Wait for the next unsolicited frame."""
+        return await self._pushed.get()
+
+    async def request_recipe_list(self) -> dict[int, Recipe]:
+        """Fetch the recipe list and wait until every slot has arrived.
+
+        The upstream client returns after the first recipe frame, with the
+        other slots still in flight. Concurrent calls are serialized, so each
+        one waits for a complete list of its own.
+        """
+        async with self._recipe_list_lock:
+            await self._connected.wait()
+            done = asyncio.get_running_loop().create_future()
+            self._recipe_list = (done, set())
+            try:
+                await self._send(SimpleRequest(request_type=MessageType.RecipeList))
+                await done
+            finally:
+                self._recipe_list = None
+            return self.recipes
+
+    def _dispatch(self, message: ResponseMessage) -> None:
+        super()._dispatch(message)
+        if message.msg_id in self._pending:
+            return
+        if isinstance(message, RecipeMessage) and self._recipe_list is not None:
+            done, slots = self._recipe_list
+            slots.add(message.recipe.recipe_no)
+            if len(slots) >= RECIPE_SLOTS and not done.done():
+                done.set_result(None)
+            return
+        if not isinstance(message, PUSHED_MESSAGE_TYPES):
+            return
+        if self._pushed.full():
+            self._pushed.get_nowait()
+        self._pushed.put_nowait(message)
@@ -0,0 +1,266 @@
+"""Long-term statistics import for Mahlkönig X54.
+
+The grinder's counters only ever grow, and what is interesting about them is
+how much they grew per hour. Instead of leaving that to the recorder's
+aggregation of whatever states happened to be written, the counters are
+imported as external statistics: one row per hour, written once the hour is
+complete.
+"""
+
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import (
+    StatisticData,
+    StatisticMeanType,
+    StatisticMetaData,
+)
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+    get_last_statistics,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import UnitOfTime
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_utc_time_change
+from homeassistant.util import dt as dt_util, slugify
+
+from mahlkoenig.models import Statistics
+
+from .const import DOMAIN
+from .coordinator import MahlkonigUpdateCoordinator
+from .grinder import RECIPE_SLOTS
+from .scheduler import Resource
+
+_LOGGER = logging.getLogger(__name__)
+
+HOUR = timedelta(hours=1)
+
+# Hours further back than this are not back-filled after a long outage.
+MAX_BACKFILL = timedelta(days=30)
+
+
+@dataclass(frozen=True, slots=True)
+class Counter:
+    """A grinder counter imported as an hourly statistic."""
+
+    key: str
+    name: str
+    unit: str | None
+    value_fn: Callable[[Statistics], float]
+
+
+COUNTERS = (
+    Counter(
+        "total_grind_shots", "Total Grind Shots", None, lambda s: s.total_grind_shots
+    ),
+    Counter(
+        "total_grind_time",
+        "Total Grind Time",
+        UnitOfTime.SECONDS,
+        lambda s: s.total_grind_time.total_seconds(),
+    ),
+    *(
+        counter
+        for recipe_no in range(1, RECIPE_SLOTS + 1)
+        for counter in (
+            Counter(
+                f"recipe_{recipe_no}_shots",
+                f"Recipe {recipe_no} Shots",
+                None,
+                lambda s, r=recipe_no: getattr(s, f"recipe_{r}_grind_shots"),
+            ),
+            Counter(
+                f"recipe_{recipe_no}_time",
+                f"Recipe {recipe_no} Time",
+                UnitOfTime.SECONDS,
+                lambda s, r=recipe_no: getattr(
+                    s, f"recipe_{r}_grind_time"
+                ).total_seconds(),
+            ),
+        )
+    ),
+    Counter(
+        "manual_mode_shots",
+        "Manual Mode Shots",
+        None,
+        lambda s: s.manual_mode_grind_shots,
+    ),
+    Counter(
+        "manual_mode_grind_time",
+        "Manual Mode Grind Time",
+        UnitOfTime.SECONDS,
+        lambda s: s.manual_mode_grind_time.total_seconds(),
+    ),
+)
+
+
+def _hour(moment: datetime) -> datetime:
+    return moment.replace(minute=0, second=0, microsecond=0)
+
+
+class StatisticsImporter:
+    """Imports the grinder's counters as hourly external statistics.
+
+    The last statistics seen in each hour are kept until the hour is over.
+    Every completed hour then gets a row with the counter values at its end,
+    also the hours in which nothing was seen (the grinder slept, or Home
+    Assistant was down): counters don't move while nobody grinds, so the
+    last known values are carried forward. A row's `state` is the counter
+    as the grinder reports it and its `sum` the counter made continuous: a
+    drop (a firmware update resets the counters) is taken as a reset to
+    zero and the value before it carried as an offset, so the growth per
+    hour, the difference between two sums, is never negative.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, coordinator: MahlkonigUpdateCoordinator
+    ) -> None:
+        """Initialize the importer of one grinder."""
+        self.hass = hass
+        self.coordinator = coordinator
+        entry = coordinator.config_entry
+        prefix = slugify(entry.unique_id or entry.entry_id)
+        self._metadata = {
+            counter.key: StatisticMetaData(
+                has_mean=False,
+                mean_type=StatisticMeanType.NONE,
+                has_sum=True,
+                name=f"{entry.title} {counter.name}",
+                source=DOMAIN,
+                statistic_id=f"{DOMAIN}:{prefix}_{counter.key}",
+                unit_of_measurement=counter.unit,
+            )
+            for counter in COUNTERS
+        }
+        # Raw counter and continuous sum per counter, per hour and overall.
+        self._observed: dict[datetime, dict[str, tuple[float, float]]] = {}
+        self._last_hour: datetime | None = None
+        self._last_values: dict[str, tuple[float, float]] | None = None
+        self._raw: dict[str, float] = {}
+        self._offsets: dict[str, float] = {}
+
+    async def async_start(self, entry: ConfigEntry) -> None:
+        """Pick up where the rows already in the recorder end.
+
+        Observing only starts once the offsets are known, so the sums stay
+        continuous with the rows already written.
+        """
+        statistic_ids = {
+            key: metadata["statistic_id"] for key, metadata in self._metadata.items()
+        }
+        last = await get_instance(self.hass).async_add_executor_job(
+            self._last_rows, statistic_ids
+        )
+        rows = {
+            key: last[statistic_id]
+            for key, statistic_id in statistic_ids.items()
+            if statistic_id in last
+        }
+        if len(rows) == len(statistic_ids):
+            self._last_hour = min(
+                dt_util.utc_from_timestamp(row["start"]) for row in rows.values()
+            )
+            self._last_values = {
+                key: (row["state"] or 0.0, row["sum"]) for key, row in rows.items()
+            }
+        for key, row in rows.items():
+            state = row["state"] or 0.0
+            self._raw[key] = state
+            self._offsets[key] = row["sum"] - state
+        self.async_observe()
+        self.async_import()
+
+        entry.async_on_unload(
+            self.coordinator.async_add_listener(
+                self.async_observe, frozenset({Resource.STATISTICS})
+            )
+        )
+        # A few seconds past the hour, so the last poll of the hour is in.
+        entry.async_on_unload(
+            async_track_utc_time_change(
+                self.hass, self.async_import, minute=0, second=10
+            )
+        )
+
+    def _last_rows(self, statistic_ids: dict[str, str]) -> dict[str, dict]:
+        """Return the newest row of each statistic (in the recorder thread)."""
+        rows = {}
+        for statistic_id in statistic_ids.values():
+            last = get_last_statistics(
+                self.hass, 1, statistic_id, False, {"state", "sum"}
+            )
+            if last := last.get(statistic_id):
+                rows[statistic_id] = last[0]
+        return rows
+
+    @callback
+    def async_observe(self) -> None:
+        """Remember the current counter values for the current hour."""
+        if (statistics := self.coordinator.data.statistics) is None:
+            return
+        observed = {}
+        for counter in COUNTERS:
+            raw = counter.value_fn(statistics)
+            if (last := self._raw.get(counter.key)) is not None and raw < last:
+                self._offsets[counter.key] = self._offsets.get(counter.key, 0.0) + last
+            self._raw[counter.key] = raw
+            observed[counter.key] = (raw, raw + self._offsets.get(counter.key, 0.0))
+        self._observed[_hour(dt_util.utcnow())] = observed
+
+    @callback
+    def async_import(self, _now: datetime | None = None) -> None:
+        """Write a row for every hour completed since the last import."""
+        current = _hour(dt_util.utcnow())
+        if self._last_hour is not None:
+            start = self._last_hour + HOUR
+        elif self._observed:
+            start = min(self._observed)
+        else:
+            return
+        start = max(start, current - MAX_BACKFILL)
+
+        rows: dict[str, list[StatisticData]] = {key: [] for key in self._metadata}
+        values = self._last_values
+        hour = start
+        while hour < current:
+            values = self._observed.get(hour, values)
+            if values is not None:
+                for key, (state, total) in values.items():
+                    rows[key].append(
+                        StatisticData(start=hour, state=state, sum=total)
+                    )
+            hour += HOUR
+
+        self._observed = {
+            hour: observed
+            for hour, observed in self._observed.items()
+            if hour >= current
+        }
+        if values is None or start >= current:
+            return
+        self._last_hour = current - HOUR
+        self._last_values = values
+        for key, metadata in self._metadata.items():
+            async_add_external_statistics(self.hass, metadata, rows[key])
+        _LOGGER.debug(
+            "Imported %d hour(s) of statistics up to %s",
+            len(rows[COUNTERS[0].key]),
+            self._last_hour,
+        )
+
+
+@callback
+def async_setup_statistics_import(
+    hass: HomeAssistant, entry: ConfigEntry, coordinator: MahlkonigUpdateCoordinator
+) -> None:
+    """Import the counters of `coordinator` into the recorder every hour."""
+    importer = StatisticsImporter(hass, coordinator)
+    entry.async_create_background_task(
+        hass,
+        importer.async_start(entry),
+        f"{DOMAIN} statistics import {entry.entry_id}",
+    )
@@ -0,0 +1,169 @@
+"""Request and connection instrumentation for Mahlkönig X54."""
+
+from bisect import bisect_left
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from .scheduler import Resource
+
+# Seconds. Wide enough to tell LAN round trips from Wi-Fi trouble from stalls.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    """Fixed-bucket histogram; memory is bounded by the number of buckets.
+
+    Quantiles are estimated by interpolating linearly inside the bucket that
+    contains them, clamped to the smallest and largest value seen.
+    """
+
+    __slots__ = ("_bounds", "_counts", "count", "total", "min", "max")
+
+    def __init__(self, bounds: Sequence[float]) -> None:
+        """Initialize an empty histogram with the given upper bucket bounds."""
+        self._bounds = tuple(bounds)
+        self._counts = [0] * (len(self._bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min: float | None = None
+        self.max: float | None = None
+
+    def add(self, value: float) -> None:
+        """Record one observation."""
+        self._counts[bisect_left(self._bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    @property
+    def mean(self) -> float | None:
+        """Return the mean of all observations."""
+        return self.total / self.count if self.count else None
+
+    def quantile(self, q: float) -> float | None:
+        """Estimate the `q` quantile (0 <= q <= 1)."""
+        if not self.count:
+            return None
+        assert self.min is not None and self.max is not None
+        rank = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self._counts):
+            if bucket_count and seen + bucket_count >= rank:
+                lower = self._bounds[index - 1] if index else self.min
+                upper = self._bounds[index] if index < len(self._bounds) else self.max
+                lower, upper = max(lower, self.min), min(upper, self.max)
+                fraction = (rank - seen) / bucket_count
+                return lower + (upper - lower) * fraction
+            seen += bucket_count
+        return self.max
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable representation."""
+        return {
+            "bounds": list(self._bounds),
+            "counts": list(self._counts),
+            "count": self.count,
+            "total": self.total,
+            "min": self.min,
+            "max": self.max,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Histogram":
+        """Rebuild a histogram from `as_dict` output."""
+        histogram = cls(data["bounds"])
+        if len(data["counts"]) == len(histogram._counts):
+            histogram._counts = list(data["counts"])
+            histogram.count = data["count"]
+            histogram.total = data["total"]
+            histogram.min = data["min"]
+            histogram.max = data["max"]
+        return histogram
+
+
+@dataclass(frozen=True, slots=True)
+class MetricsSummary:
+    """Point-in-time copy of the headline metrics, for entities."""
+
+    connects: int = 0
+    connect_failures: int = 0
+    timeouts: int = 0
+    auth_failures: int = 0
+    protocol_errors: int = 0
+    tick_overruns: int = 0
+    tick_p95: float | None = None
+    request_p95: float | None = None
+
+
+class GrinderMetrics:
+    """Counters and latency histograms of one grinder connection."""
+
+    def __init__(self) -> None:
+        """Initialize all counters at zero."""
+        self.connects = 0
+        self.connect_failures = 0
+        self.timeouts = 0
+        self.auth_failures = 0
+        self.protocol_errors = 0
+        # Single-resource refreshes that failed other than by timing out.
+        self.request_failures = 0
+        self.ticks = 0
+        self.tick_overruns = 0
+        self.connect_duration = Histogram(LATENCY_BUCKETS)
+        self.tick_duration = Histogram(LATENCY_BUCKETS)
+        self.all_requests = Histogram(LATENCY_BUCKETS)
+        self.requests = {resource: Histogram(LATENCY_BUCKETS) for resource in Resource}
+
+    def record_request(self, resource: Resource, seconds: float) -> None:
+        """Record the round trip of one successful request."""
+        self.requests[resource].add(seconds)
+        self.all_requests.add(seconds)
+
+    def record_connect(self, seconds: float, success: bool) -> None:
+        """Record one connect attempt."""
+        self.connects += 1
+        if success:
+            self.connect_duration.add(seconds)
+        else:
+            self.connect_failures += 1
+
+    def record_tick(self, seconds: float, budget: float) -> None:
+        """Record one coordinator tick that talked to the grinder."""
+        self.ticks += 1
+        self.tick_duration.add(seconds)
+        if seconds > budget:
+            self.tick_overruns += 1
+
+    def summary(self) -> MetricsSummary:
+        """Return the headline metrics."""
+        return MetricsSummary(
+            connects=self.connects,
+            connect_failures=self.connect_failures,
+            timeouts=self.timeouts,
+            auth_failures=self.auth_failures,
+            protocol_errors=self.protocol_errors,
+            tick_overruns=self.tick_overruns,
+            tick_p95=self.tick_duration.quantile(0.95),
+            request_p95=self.all_requests.quantile(0.95),
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return everything, for the diagnostics download."""
+        return {
+            "connects": self.connects,
+            "connect_failures": self.connect_failures,
+            "timeouts": self.timeouts,
+            "auth_failures": self.auth_failures,
+            "protocol_errors": self.protocol_errors,
+            "request_failures": self.request_failures,
+            "ticks": self.ticks,
+            "tick_overruns": self.tick_overruns,
+            "connect_duration": self.connect_duration.as_dict(),
+            "tick_duration": self.tick_duration.as_dict(),
+            "requests": {
+                resource: histogram.as_dict()
+                for resource, histogram in self.requests.items()
+            },
+        }
@@ -0,0 +1,80 @@
+"""Recipe bookkeeping for Mahlkönig X54."""
+
+from collections.abc import Mapping
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any
+
+from mahlkoenig import Recipe
+
+
+class RecipeAttributeCache:
+    """Builds the state attributes of each recipe once per revision.
+
+    The grinder bumps a recipe's `last_modify_index` whenever it is edited,
+    so the mapping is only rebuilt then. All sensors of a recipe slot share
+    the same immutable mapping.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self._cache: dict[int, tuple[tuple[str, int], Mapping[str, Any]]] = {}
+
+    def get(self, recipe: Recipe) -> Mapping[str, Any]:
+        """Return the state attributes of `recipe`."""
+        revision = (recipe.guid, recipe.last_modify_index)
+        cached = self._cache.get(recipe.recipe_no)
+        if cached is not None and cached[0] == revision:
+            return cached[1]
+        attributes = MappingProxyType(
+            {
+                "bean_name": recipe.bean_name,
+                "brewing_type": recipe.brewing_type.name,
+                "grinding_degree": recipe.grinding_degree,
+                "guid": recipe.guid,
+                "last_modify_index": recipe.last_modify_index,
+                "last_modify_time": recipe.last_modify_time,
+                "name": recipe.name,
+                "recipe_no": recipe.recipe_no,
+            }
+        )
+        self._cache[recipe.recipe_no] = (revision, attributes)
+        return attributes
+
+
+class RecipeIndex:
+    """Revision of every recipe slot as of the last recipe list fetch.
+
+    The X54 can only send the whole recipe list, so the list is refetched
+    only on evidence that a recipe changed. Comparing against the index
+    tells which slots a fetch actually changed, and whether recipes the
+    grinder sent on its own disagree with what was fetched.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._revisions: dict[int, tuple[int, datetime]] = {}
+
+    @staticmethod
+    def _revision(recipe: Recipe) -> tuple[int, datetime]:
+        return (recipe.last_modify_index, recipe.last_modify_time)
+
+    def record(self, recipes: Mapping[int, Recipe]) -> set[int]:
+        """Index a freshly fetched recipe list; return the changed slots."""
+        revisions = {
+            recipe_no: self._revision(recipe) for recipe_no, recipe in recipes.items()
+        }
+        changed = {
+            recipe_no
+            for recipe_no in revisions.keys() | self._revisions.keys()
+            if revisions.get(recipe_no) != self._revisions.get(recipe_no)
+        }
+        self._revisions = revisions
+        return changed
+
+    def is_skewed(self, recipes: Mapping[int, Recipe]) -> bool:
+        """Return True if any of `recipes` has a revision the index lacks."""
+        return any(
+            self._revisions.get(recipe_no) != self._revision(recipe)
+            for recipe_no, recipe in recipes.items()
+        )
@@ -0,0 +1,94 @@
+"""Per-resource refresh scheduling for Mahlkönig X54."""
+
+import heapq
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from datetime import timedelta
+from enum import StrEnum
+from time import monotonic
+
+
+class Resource(StrEnum):
+    """A piece of grinder state that is fetched with its own request."""
+
+    MACHINE_INFO = "machine_info"
+    SYSTEM_STATUS = "system_status"
+    AUTO_SLEEP_TIME = "auto_sleep_time"
+    RECIPES = "recipes"
+    STATISTICS = "statistics"
+    WIFI_INFO = "wifi_info"
+
+
+@dataclass(frozen=True, slots=True)
+class ResourcePolicy:
+    """How often a resource is refetched, and how urgently when due.
+
+    Lower `priority` values are requested first when several resources are due
+    in the same tick.
+    """
+
+    ttl: timedelta
+    priority: int
+
+
+class ResourceScheduler:
+    """Min-heap of monotonic refresh deadlines, one per resource.
+
+    Deadlines use a monotonic clock so wall-clock jumps (NTP, DST) neither
+    trigger a mass refetch nor stall updates. Superseded heap entries are
+    skipped lazily instead of being removed in place.
+    """
+
+    def __init__(
+        self,
+        policies: Mapping[Resource, ResourcePolicy],
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        """Initialize the scheduler with every resource due immediately."""
+        self._policies = dict(policies)
+        self._clock = clock
+        self._deadlines: dict[Resource, float] = {}
+        self._heap: list[tuple[float, int, Resource]] = []
+        self.mark_all_due()
+
+    def _schedule(self, resource: Resource, deadline: float) -> None:
+        self._deadlines[resource] = deadline
+        heapq.heappush(
+            self._heap, (deadline, self._policies[resource].priority, resource)
+        )
+
+    def pop_due(self) -> list[Resource]:
+        """Remove and return every due resource, highest priority first.
+
+        Callers must hand each returned resource back via `complete` or
+        `requeue`, otherwise it is never scheduled again.
+        """
+        now = self._clock()
+        due: list[Resource] = []
+        while self._heap and self._heap[0][0] <= now:
+            deadline, _, resource = heapq.heappop(self._heap)
+            if self._deadlines.get(resource) != deadline:
+                continue
+            del self._deadlines[resource]
+            due.append(resource)
+        due.sort(key=lambda resource: self._policies[resource].priority)
+        return due
+
+    def complete(self, resource: Resource) -> None:
+        """Record a fresh copy of `resource`; it is due again after its TTL."""
+        ttl = self._policies[resource].ttl.total_seconds()
+        self._schedule(resource, self._clock() + ttl)
+
+    def requeue(self, resource: Resource) -> None:
+        """Put a popped but unfetched resource back, due on the next tick."""
+        self._schedule(resource, self._clock())
+
+    def mark_due(self, resource: Resource) -> None:
+        """Make `resource` due immediately, e.g. because it is known stale."""
+        self._schedule(resource, self._clock())
+
+    def mark_all_due(self) -> None:
+        """Make every resource due immediately."""
+        now = self._clock()
+        for resource in self._policies:
+            self._schedule(resource, now)
@@ -1,6 +1,10 @@
 """Select platform for Mahlkönig X54."""
 
+import asyncio
+
+import aiohttp
 from mahlkoenig import AutoSleepTimePreset
+from mahlkoenig.exceptions import MahlkoenigConnectionError
 from homeassistant.components.select import (
     SelectEntity,
     SelectEntityDescription,
@@ -8,10 +12,13 @@ from homeassistant.components.select import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .coordinator import MahlkonigUpdateCoordinator
+from .const import DOMAIN
+from .coordinator import UPDATE_TIMEOUT, MahlkonigUpdateCoordinator
 from .entity import MahlkonigEntity
+from .scheduler import Resource
 
 # Coordinator is used to centralize the data updates
 PARALLEL_UPDATES = 0
@@ -34,9 +41,9 @@ async def async_setup_entry(
                     entity_category=EntityCategory.CONFIG,
                     icon="mdi:clock-time-four",
                 ),
+                snapshot_keys={Resource.AUTO_SLEEP_TIME},
             )
-        ],
-        update_before_add=True,
+        ]
     )
 
 
@@ -45,13 +52,18 @@ class AutoSleepTimeSelect(MahlkonigEntity[SelectEntityDescription], SelectEntity
 
     entity_description: SelectEntityDescription
 
+    # The chosen preset, shown until the grinder has confirmed it.
+    _optimistic_option: str | None = None
+
     @property
     def options(self) -> list[str]:
         return [str(preset) for preset in AutoSleepTimePreset]
 
     @property
     def current_option(self) -> str | None:
-        sleep = self.coordinator.grinder.auto_sleep_time
+        if self._optimistic_option is not None:
+            return self._optimistic_option
+        sleep = self.coordinator.data.auto_sleep_time
         return str(sleep) if sleep is not None else None
 
     @property
@@ -62,5 +74,30 @@ class AutoSleepTimeSelect(MahlkonigEntity[SelectEntityDescription], SelectEntity
     async def async_select_option(self, option: str) -> None:
         """Called when the user chooses a new preset."""
         preset = next(preset for preset in AutoSleepTimePreset if option == str(preset))
-        await self.coordinator.grinder.set_auto_sleep_time(preset)
-        await self.coordinator.async_request_refresh()
+        if not self.coordinator.available:
+            raise HomeAssistantError(
+                translation_domain=DOMAIN, translation_key="grinder_not_connected"
+            )
+        self._optimistic_option = option
+        self.async_write_ha_state()
+        try:
+            async with asyncio.timeout(UPDATE_TIMEOUT.total_seconds()):
+                await self.coordinator.grinder.set_auto_sleep_time(preset)
+            # The response usually carries the new setting; when the grinder
+            # only acknowledges the change, read it back before publishing.
+            if self.coordinator.grinder.auto_sleep_time != preset:
+                await self.coordinator.async_refresh_resource(Resource.AUTO_SLEEP_TIME)
+            else:
+                self.coordinator.async_publish()
+        except (
+            MahlkoenigConnectionError,
+            aiohttp.ClientConnectionResetError,
+            RuntimeError,
+            asyncio.TimeoutError,
+        ) as err:
+            raise HomeAssistantError(
+                translation_domain=DOMAIN, translation_key="setting_not_applied"
+            ) from err
+        finally:
+            self._optimistic_option = None
+            self.async_write_ha_state()
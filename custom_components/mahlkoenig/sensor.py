@@ -1,55 +1,47 @@
 """Sensor platform for Mahlkönig X54."""
 
-import logging
-
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
+from datetime import datetime, timedelta
+from time import monotonic
 from typing import Any
 
 from homeassistant.components.sensor import (
-    SensorDeviceClass,
     RestoreSensor,
+    SensorDeviceClass,
     SensorEntity,
     SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory, UnitOfTime
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_time_interval
 
-from mahlkoenig import Grinder, Recipe
-
+from .const import CONF_GRIND_TIMER_RATE, DEFAULT_GRIND_TIMER_RATE
 from .coordinator import MahlkonigUpdateCoordinator
 from .entity import MahlkonigEntity
+from .grind import MANUAL
+from .scheduler import Resource
+from .usage import TOTAL
+from .snapshot import METRICS, SHOT_DURATIONS, USAGE, GrinderSnapshot, recipe_key
 
 # Coordinator is used to centralize the data updates
 PARALLEL_UPDATES = 0
 
-_LOGGER = logging.getLogger(__name__)
-
 
 @dataclass(kw_only=True, frozen=True)
 class MahlkonigSensorEntityDescription(SensorEntityDescription):
     """Description for X54 sensor entities."""
 
-    value_fn: Callable[[Grinder], int | float | str | None] = lambda _: None
-    attr_fn: Callable[[Grinder], dict[str, Any] | None] = lambda _: None
+    snapshot_keys: frozenset[str] = frozenset()
+    value_fn: Callable[[GrinderSnapshot], int | float | str | None] = lambda _: None
+    attr_fn: Callable[[GrinderSnapshot], Mapping[str, Any] | None] = lambda _: None
 
 
-def _recipe_attrs(recipe: Recipe | None) -> dict[str, Any] | None:
-    if recipe is None:
-        return None
-    return {
-        "bean_name": recipe.bean_name,
-        "brewing_type": recipe.brewing_type.name,
-        "grinding_degree": recipe.grinding_degree,
-        "guid": recipe.guid,
-        "last_modify_index": recipe.last_modify_index,
-        "last_modify_time": recipe.last_modify_time,
-        "name": recipe.name,
-        "recipe_no": recipe.recipe_no,
-    }
+def _ms(seconds: float | None) -> float | None:
+    return None if seconds is None else round(seconds * 1000, 1)
 
 
 async def async_setup_entry(
@@ -69,7 +61,8 @@ async def async_setup_entry(
             entity_category=EntityCategory.DIAGNOSTIC,
             icon="mdi:clock-time-four",
             state_class=SensorStateClass.MEASUREMENT,
-            value_fn=lambda grinder: grinder.machine_info.disc_life_time.total_seconds(),
+            snapshot_keys=frozenset({Resource.MACHINE_INFO}),
+            value_fn=lambda data: data.machine_info.disc_life_time.total_seconds(),
         ),
         MahlkonigSensorEntityDescription(
             key="total_on_time",
@@ -79,8 +72,9 @@ async def async_setup_entry(
             suggested_unit_of_measurement=UnitOfTime.HOURS,
             entity_category=EntityCategory.DIAGNOSTIC,
             icon="mdi:clock-time-four",
-            state_class=SensorStateClass.MEASUREMENT,
-            value_fn=lambda grinder: grinder.statistics.total_on_time.total_seconds(),
+            state_class=SensorStateClass.TOTAL_INCREASING,
+            snapshot_keys=frozenset({Resource.STATISTICS}),
+            value_fn=lambda data: data.statistics.total_on_time.total_seconds(),
         ),
         MahlkonigSensorEntityDescription(
             key="system_restarts",
@@ -88,7 +82,8 @@ async def async_setup_entry(
             entity_category=EntityCategory.DIAGNOSTIC,
             icon="mdi:numeric",
             state_class=SensorStateClass.TOTAL_INCREASING,
-            value_fn=lambda grinder: grinder.statistics.system_restarts,
+            snapshot_keys=frozenset({Resource.STATISTICS}),
+            value_fn=lambda data: data.statistics.system_restarts,
         ),
         MahlkonigSensorEntityDescription(
             key="total_grind_shots",
@@ -96,7 +91,8 @@ async def async_setup_entry(
             entity_category=EntityCategory.DIAGNOSTIC,
             icon="mdi:numeric",
             state_class=SensorStateClass.TOTAL_INCREASING,
-            value_fn=lambda grinder: grinder.statistics.total_grind_shots,
+            snapshot_keys=frozenset({Resource.STATISTICS}),
+            value_fn=lambda data: data.statistics.total_grind_shots,
         ),
         MahlkonigSensorEntityDescription(
             key="total_grind_time",
@@ -106,8 +102,9 @@ async def async_setup_entry(
             suggested_unit_of_measurement=UnitOfTime.HOURS,
             entity_category=EntityCategory.DIAGNOSTIC,
             icon="mdi:clock-time-four",
-            state_class=SensorStateClass.MEASUREMENT,
-            value_fn=lambda grinder: grinder.statistics.total_grind_time.total_seconds(),
+            state_class=SensorStateClass.TOTAL_INCREASING,
+            snapshot_keys=frozenset({Resource.STATISTICS}),
+            value_fn=lambda data: data.statistics.total_grind_time.total_seconds(),
         ),
         MahlkonigSensorEntityDescription(
             key="total_motor_on_time",
@@ -117,8 +114,9 @@ async def async_setup_entry(
             suggested_unit_of_measurement=UnitOfTime.MINUTES,
             entity_category=EntityCategory.DIAGNOSTIC,
             icon="mdi:clock-time-four",
-            state_class=SensorStateClass.MEASUREMENT,
-            value_fn=lambda grinder: grinder.statistics.total_motor_on_time.total_seconds(),
+            state_class=SensorStateClass.TOTAL_INCREASING,
+            snapshot_keys=frozenset({Resource.STATISTICS}),
+            value_fn=lambda data: data.statistics.total_motor_on_time.total_seconds(),
         ),
         MahlkonigSensorEntityDescription(
             key="standby_time",
@@ -128,8 +126,9 @@ async def async_setup_entry(
             suggested_unit_of_measurement=UnitOfTime.HOURS,
             entity_category=EntityCategory.DIAGNOSTIC,
             icon="mdi:clock-time-four",
-            state_class=SensorStateClass.MEASUREMENT,
-            value_fn=lambda grinder: grinder.statistics.standby_time.total_seconds(),
+            state_class=SensorStateClass.TOTAL_INCREASING,
+            snapshot_keys=frozenset({Resource.STATISTICS}),
+            value_fn=lambda data: data.statistics.standby_time.total_seconds(),
         ),
     ]
 
@@ -142,16 +141,15 @@ async def async_setup_entry(
                 device_class=SensorDeviceClass.DURATION,
                 icon="mdi:av-timer",
                 state_class=SensorStateClass.TOTAL_INCREASING,
-                attr_fn=lambda grinder, r=recipe_no: _recipe_attrs(
-                    grinder.recipes.get(r)
-                ),
-                value_fn=lambda grinder, r=recipe_no: (
-                    (recipe := grinder.recipes.get(r))
+                snapshot_keys=frozenset({recipe_key(recipe_no)}),
+                attr_fn=lambda data, r=recipe_no: data.recipe_attributes.get(r),
+                value_fn=lambda data, r=recipe_no: (
+                    (recipe := data.recipes.get(r))
                     and recipe.grind_time.total_seconds()
                 ),
             )
             # The X54 always exposes recipes 1–4. Iterating over a fixed range
-            # rather than `coordinator.grinder.recipes.keys()` ensures the
+            # rather than `coordinator.data.recipes.keys()` ensures the
             # entities exist even when we cold-boot with the grinder offline.
             for recipe_no in range(1, 5)
         ]
@@ -167,7 +165,8 @@ async def async_setup_entry(
                 device_class=SensorDeviceClass.DURATION,
                 icon="mdi:av-timer",
                 state_class=SensorStateClass.TOTAL_INCREASING,
-                value_fn=lambda grinder: grinder.statistics.manual_mode_grind_time.total_seconds(),
+                snapshot_keys=frozenset({Resource.STATISTICS}),
+                value_fn=lambda data: data.statistics.manual_mode_grind_time.total_seconds(),
             )
         ]
     )
@@ -179,11 +178,10 @@ async def async_setup_entry(
                 name=f"Recipe {recipe_no} Shots",
                 state_class=SensorStateClass.TOTAL_INCREASING,
                 icon="mdi:numeric",
-                attr_fn=lambda grinder, r=recipe_no: _recipe_attrs(
-                    grinder.recipes.get(r)
-                ),
-                value_fn=lambda grinder, r=recipe_no: getattr(
-                    grinder.statistics, f"recipe_{r}_grind_shots"
+                snapshot_keys=frozenset({Resource.STATISTICS, recipe_key(recipe_no)}),
+                attr_fn=lambda data, r=recipe_no: data.recipe_attributes.get(r),
+                value_fn=lambda data, r=recipe_no: getattr(
+                    data.statistics, f"recipe_{r}_grind_shots"
                 ),
             )
             for recipe_no in range(1, 5)
@@ -200,11 +198,10 @@ async def async_setup_entry(
                 device_class=SensorDeviceClass.DURATION,
                 state_class=SensorStateClass.TOTAL_INCREASING,
                 icon="mdi:clock-time-four",
-                attr_fn=lambda grinder, r=recipe_no: _recipe_attrs(
-                    grinder.recipes.get(r)
-                ),
-                value_fn=lambda grinder, r=recipe_no: getattr(
-                    grinder.statistics, f"recipe_{r}_grind_time"
+                snapshot_keys=frozenset({Resource.STATISTICS, recipe_key(recipe_no)}),
+                attr_fn=lambda data, r=recipe_no: data.recipe_attributes.get(r),
+                value_fn=lambda data, r=recipe_no: getattr(
+                    data.statistics, f"recipe_{r}_grind_time"
                 ).total_seconds(),
             )
             for recipe_no in range(1, 5)
@@ -218,7 +215,8 @@ async def async_setup_entry(
                 name="Manual Mode Shots",
                 state_class=SensorStateClass.TOTAL_INCREASING,
                 icon="mdi:numeric",
-                value_fn=lambda grinder: grinder.statistics.manual_mode_grind_shots,
+                snapshot_keys=frozenset({Resource.STATISTICS}),
+                value_fn=lambda data: data.statistics.manual_mode_grind_shots,
             )
         ]
     )
@@ -232,8 +230,9 @@ async def async_setup_entry(
                 entity_category=EntityCategory.DIAGNOSTIC,
                 icon="mdi:numeric",
                 entity_registry_enabled_default=False,
-                value_fn=lambda grinder, e=error_no: getattr(
-                    grinder.statistics, f"total_errors_{e:02}"
+                snapshot_keys=frozenset({Resource.STATISTICS}),
+                value_fn=lambda data, e=error_no: getattr(
+                    data.statistics, f"total_errors_{e:02}"
                 ),
             )
             for (error_no, kind) in [
@@ -248,28 +247,169 @@ async def async_setup_entry(
         ]
     )
 
+    entity_descriptions.extend(
+        [
+            MahlkonigSensorEntityDescription(
+                key=f"{prefix}_shot_duration",
+                name=f"{label} Shot Duration",
+                native_unit_of_measurement=UnitOfTime.SECONDS,
+                device_class=SensorDeviceClass.DURATION,
+                state_class=SensorStateClass.MEASUREMENT,
+                suggested_display_precision=1,
+                icon="mdi:timer-outline",
+                snapshot_keys=frozenset({SHOT_DURATIONS}),
+                # Median of every shot measured by this integration.
+                value_fn=lambda data, s=slot: data.shot_durations[s].p50,
+                attr_fn=lambda data, s=slot: data.shot_durations[s].attributes,
+            )
+            for slot, prefix, label in [
+                *(
+                    (str(recipe_no), f"recipe_{recipe_no}", f"Recipe {recipe_no}")
+                    for recipe_no in range(1, 5)
+                ),
+                (MANUAL, "manual_mode", "Manual Mode"),
+            ]
+        ]
+    )
+
+    for series, prefix, label in [
+        (TOTAL, "", ""),
+        *(
+            (str(recipe_no), f"recipe_{recipe_no}_", f"Recipe {recipe_no} ")
+            for recipe_no in range(1, 5)
+        ),
+        (MANUAL, "manual_mode_", "Manual Mode "),
+    ]:
+        entity_descriptions.extend(
+            [
+                MahlkonigSensorEntityDescription(
+                    key=f"{prefix}shots_per_hour",
+                    name=f"{label}Shots per Hour",
+                    native_unit_of_measurement="shots/h",
+                    state_class=SensorStateClass.MEASUREMENT,
+                    suggested_display_precision=0,
+                    icon="mdi:speedometer",
+                    entity_registry_enabled_default=series == TOTAL,
+                    snapshot_keys=frozenset({USAGE}),
+                    # Shots ground within the last hour.
+                    value_fn=lambda data, s=series: data.usage[s].shots_per_hour,
+                ),
+                MahlkonigSensorEntityDescription(
+                    key=f"{prefix}shots_today",
+                    name=f"{label}Shots Today",
+                    state_class=SensorStateClass.TOTAL_INCREASING,
+                    icon="mdi:counter",
+                    entity_registry_enabled_default=series == TOTAL,
+                    snapshot_keys=frozenset({USAGE}),
+                    value_fn=lambda data, s=series: data.usage[s].shots_today,
+                ),
+                MahlkonigSensorEntityDescription(
+                    key=f"{prefix}grind_time_today",
+                    name=f"{label}Grind Time Today",
+                    native_unit_of_measurement=UnitOfTime.SECONDS,
+                    device_class=SensorDeviceClass.DURATION,
+                    state_class=SensorStateClass.TOTAL_INCREASING,
+                    suggested_display_precision=1,
+                    icon="mdi:timer-sand",
+                    entity_registry_enabled_default=series == TOTAL,
+                    snapshot_keys=frozenset({USAGE}),
+                    value_fn=lambda data, s=series: data.usage[s].grind_time_today,
+                ),
+            ]
+        )
+
     sensors: list[SensorEntity] = [
-        GrinderRestoreSensor(coordinator, entity_description)
+        GrinderCachedSensor(
+            coordinator, entity_description, entity_description.snapshot_keys
+        )
         for entity_description in entity_descriptions
     ]
 
+    active_menu_description = MahlkonigSensorEntityDescription(
+        key="active_menu",
+        name="Active Menu",
+        device_class=SensorDeviceClass.ENUM,
+        options=["1", "2", "3", "4"],
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon="mdi:dots-horizontal",
+        state_class=None,
+        snapshot_keys=frozenset({Resource.SYSTEM_STATUS}),
+        value_fn=lambda data: str(data.system_status.active_menu),
+    )
     sensors.append(
         GrinderSensor(
+            coordinator,
+            active_menu_description,
+            active_menu_description.snapshot_keys,
+        )
+    )
+
+    grind_timer_rate = entry.options.get(
+        CONF_GRIND_TIMER_RATE, DEFAULT_GRIND_TIMER_RATE
+    )
+    sensors.append(
+        GrindTimerSensor(
             coordinator,
             MahlkonigSensorEntityDescription(
-                key="active_menu",
-                name="Active Menu",
-                device_class=SensorDeviceClass.ENUM,
-                options=["1", "2", "3", "4"],
-                entity_category=EntityCategory.DIAGNOSTIC,
-                icon="mdi:dots-horizontal",
-                state_class=None,
-                value_fn=lambda grinder: str(grinder.system_status.active_menu),
+                key="grind_timer",
+                name="Grind Timer",
+                native_unit_of_measurement=UnitOfTime.SECONDS,
+                device_class=SensorDeviceClass.DURATION,
+                suggested_display_precision=1,
+                icon="mdi:timer-play-outline",
             ),
+            timedelta(seconds=1 / grind_timer_rate),
         )
     )
 
-    async_add_entities(sensors, update_before_add=True)
+    metric_descriptions = [
+        MahlkonigSensorEntityDescription(
+            key="request_latency_p95",
+            name="Request Latency (p95)",
+            device_class=SensorDeviceClass.DURATION,
+            native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+            state_class=SensorStateClass.MEASUREMENT,
+            value_fn=lambda data: _ms(data.metrics.request_p95),
+        ),
+        MahlkonigSensorEntityDescription(
+            key="tick_duration_p95",
+            name="Update Duration (p95)",
+            device_class=SensorDeviceClass.DURATION,
+            native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+            state_class=SensorStateClass.MEASUREMENT,
+            value_fn=lambda data: _ms(data.metrics.tick_p95),
+        ),
+        MahlkonigSensorEntityDescription(
+            key="connect_failures",
+            name="Connect Failures",
+            state_class=SensorStateClass.TOTAL_INCREASING,
+            value_fn=lambda data: data.metrics.connect_failures,
+        ),
+        MahlkonigSensorEntityDescription(
+            key="request_timeouts",
+            name="Request Timeouts",
+            state_class=SensorStateClass.TOTAL_INCREASING,
+            value_fn=lambda data: data.metrics.timeouts,
+        ),
+        MahlkonigSensorEntityDescription(
+            key="protocol_errors",
+            name="Protocol Errors",
+            state_class=SensorStateClass.TOTAL_INCREASING,
+            value_fn=lambda data: data.metrics.protocol_errors,
+        ),
+        MahlkonigSensorEntityDescription(
+            key="tick_overruns",
+            name="Update Overruns",
+            state_class=SensorStateClass.TOTAL_INCREASING,
+            value_fn=lambda data: data.metrics.tick_overruns,
+        ),
+    ]
+    sensors.extend(
+        GrinderMetricSensor(coordinator, description, {METRICS})
+        for description in metric_descriptions
+    )
+
+    async_add_entities(sensors)
 
 
 class GrinderSensor(MahlkonigEntity[MahlkonigSensorEntityDescription], SensorEntity):
@@ -277,70 +417,198 @@ class GrinderSensor(MahlkonigEntity[MahlkonigSensorEntityDescription], SensorEnt
 
     entity_description: MahlkonigSensorEntityDescription
 
+    async def async_added_to_hass(self) -> None:
+        """Handle entity which will be added."""
+        await super().async_added_to_hass()
+        self._update_native_value()
+
+    def _update_native_value(self) -> None:
+        """Take the value from the snapshot while the grinder is connected."""
+        if not self.coordinator.data.connected:
+            return
+        try:
+            self._attr_native_value = self.entity_description.value_fn(
+                self.coordinator.data
+            )
+        except AttributeError:
+            # Connected, but the resource hasn't arrived yet; a connection
+            # handed over by the config flow has only the machine info.
+            self._attr_native_value = None
+
     @property
     def available(self) -> bool:
         """Live entities are only available while the grinder is connected."""
-        return self.coordinator.grinder.connected
+        return self.coordinator.data.connected
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
+    def extra_state_attributes(self) -> Mapping[str, Any] | None:
         """Return extra attributes."""
-        return self.entity_description.attr_fn(self.coordinator.grinder)
+        return self.entity_description.attr_fn(self.coordinator.data)
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        if self.coordinator.grinder.connected:
-            self._attr_native_value = self.entity_description.value_fn(
-                self.coordinator.grinder
-            )
-
+        self._update_native_value()
         super()._handle_coordinator_update()
 
 
-class GrinderRestoreSensor(
-    MahlkonigEntity[MahlkonigSensorEntityDescription], RestoreSensor
+class GrindTimerSensor(
+    MahlkonigEntity[MahlkonigSensorEntityDescription], SensorEntity
 ):
-    """Cached sensor — keeps last-known value when the grinder is offline."""
+    """Running time of the current shot, or of the last one while idle.
+
+    Status frames arrive about twice a second during a shot. Between them the
+    timer runs on locally from the last frame, and the state is written on
+    its own fixed interval rather than per frame. The grinder's exact time
+    is written as soon as the shot stops.
+    """
 
     entity_description: MahlkonigSensorEntityDescription
-    _attr_native_value = None
+
+    def __init__(
+        self,
+        coordinator: MahlkonigUpdateCoordinator,
+        entity_description: MahlkonigSensorEntityDescription,
+        write_interval: timedelta,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entity_description, {Resource.SYSTEM_STATUS})
+        self._write_interval = write_interval
+        # Grind time of the last frame of the running shot and when it arrived.
+        self._anchor: tuple[float, float] | None = None
+        self._shot_time = 0.0
+        self._cancel_tick: CALLBACK_TYPE | None = None
+
+    @property
+    def available(self) -> bool:
+        """Only available while connected."""
+        return self.coordinator.data.connected
 
     async def async_added_to_hass(self) -> None:
         """Handle entity which will be added."""
         await super().async_added_to_hass()
+        self.async_on_remove(self._async_stop_ticking)
+        self._async_follow_status()
 
-        restored_data = await self.async_get_last_sensor_data()
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        if self._async_follow_status():
+            super()._handle_coordinator_update()
 
-        if restored_data is not None:
-            _LOGGER.debug(
-                "Restoring sensor data for Mahlkoenig %s",
-                self.entity_description.name,
-            )
-            self._attr_native_value = restored_data.native_value
+    @callback
+    def _async_follow_status(self) -> bool:
+        """Track the latest status; return True if the state should be written.
+
+        Frames of a running shot only move the anchor; the tick writes them.
+        """
+        data = self.coordinator.data
+        status = data.system_status if data.connected else None
+        if status is None or not status.grind_running:
+            self._async_stop_ticking()
+            if status is not None and self._anchor is not None:
+                # The shot just stopped; the grinder's own timer is exact.
+                self._shot_time = max(
+                    self._shot_time, status.grind_time.total_seconds()
+                )
+                self._attr_native_value = round(self._shot_time, 1)
+            elif status is not None and self._attr_native_value is None:
+                self._attr_native_value = round(
+                    status.grind_time.total_seconds(), 1
+                )
+            self._anchor = None
+            return True
+
+        grind_time = status.grind_time.total_seconds()
+        self._anchor = (grind_time, monotonic())
+        if self._cancel_tick is not None:
+            self._shot_time = max(self._shot_time, grind_time)
+            return False
+        self._shot_time = grind_time
+        self._attr_native_value = round(grind_time, 1)
+        self._cancel_tick = async_track_time_interval(
+            self.hass, self._async_tick, self._write_interval
+        )
+        return True
 
-        if self.coordinator.grinder.connected:
-            self._attr_native_value = self.entity_description.value_fn(
-                self.coordinator.grinder
-            )
+    @callback
+    def _async_tick(self, _now: datetime) -> None:
+        """Write the interpolated time of the running shot."""
+        if self._anchor is None:
+            return
+        grind_time, received = self._anchor
+        elapsed = grind_time + monotonic() - received
+        self._attr_native_value = round(
+            max(elapsed, self._attr_native_value or 0.0), 1
+        )
+        self.async_write_ha_state()
+
+    @callback
+    def _async_stop_ticking(self) -> None:
+        if self._cancel_tick is not None:
+            self._cancel_tick()
+            self._cancel_tick = None
+
+
+class GrinderCachedSensor(
+    MahlkonigEntity[MahlkonigSensorEntityDescription], RestoreSensor
+):
+    """Cached sensor — keeps last-known value when the grinder is offline.
+
+    The coordinator snapshot falls back to the state stored by the previous
+    run, so values and attributes survive a restart while the grinder sleeps.
+    Before the first Store file is written (the first start after updating
+    from a version without it) the restored sensor state fills in instead.
+    """
+
+    entity_description: MahlkonigSensorEntityDescription
+    _restored_value: int | float | str | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Restore the last state if the coordinator has nothing stored."""
+        await super().async_added_to_hass()
+        if self.coordinator.has_stored_state:
+            return
+        if (restored := await self.async_get_last_sensor_data()) is not None:
+            self._restored_value = restored.native_value
+
+    @property
+    def native_value(self) -> int | float | str | None:
+        """Return the last known value."""
+        try:
+            value = self.entity_description.value_fn(self.coordinator.data)
+        except AttributeError:
+            # The resource was neither received nor stored yet.
+            value = None
+        return self._restored_value if value is None else value
 
     @property
     def available(self) -> bool:
-        """Available as long as we have any value (live or restored)."""
-        return self._attr_native_value is not None
+        """Available as long as we have any value (live or stored)."""
+        return self.native_value is not None
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
+    def extra_state_attributes(self) -> Mapping[str, Any] | None:
         """Return extra attributes."""
-        if not self.coordinator.grinder.connected:
-            return None
-        return self.entity_description.attr_fn(self.coordinator.grinder)
+        return self.entity_description.attr_fn(self.coordinator.data)
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        if self.coordinator.grinder.connected:
-            self._attr_native_value = self.entity_description.value_fn(
-                self.coordinator.grinder
-            )
-        super()._handle_coordinator_update()
+
+class GrinderMetricSensor(
+    MahlkonigEntity[MahlkonigSensorEntityDescription], SensorEntity
+):
+    """Connection health sensor, computed by the integration itself."""
+
+    entity_description: MahlkonigSensorEntityDescription
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_icon = "mdi:chart-bell-curve"
+
+    @property
+    def available(self) -> bool:
+        """Metrics exist whether or not the grinder is connected."""
+        return True
+
+    @property
+    def native_value(self) -> int | float | str | None:
+        """Return the current metric value."""
+        return self.entity_description.value_fn(self.coordinator.data)
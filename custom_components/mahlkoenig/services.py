@@ -0,0 +1,59 @@
+"""Services for Mahlkönig X54."""
+
+import asyncio
+
+import voluptuous as vol
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+
+from .const import DOMAIN
+
+SERVICE_REFRESH_RECIPES = "refresh_recipes"
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+
+REFRESH_RECIPES_SCHEMA = vol.Schema({vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string})
+
+
+async def _async_refresh_recipes(call: ServiceCall) -> None:
+    """Refetch the recipe list of one grinder, or of all of them.
+
+    A grinder that isn't connected fetches the list once it is reachable
+    again. One that is connected but fails to answer fails the call; the
+    list stays due for its next update.
+    """
+    entries = [
+        entry
+        for entry in call.hass.config_entries.async_entries(DOMAIN)
+        if entry.state is ConfigEntryState.LOADED
+    ]
+    if (entry_id := call.data.get(ATTR_CONFIG_ENTRY_ID)) is not None:
+        entries = [entry for entry in entries if entry.entry_id == entry_id]
+        if not entries:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="entry_not_loaded",
+                translation_placeholders={"entry_id": entry_id},
+            )
+    results = await asyncio.gather(
+        *(entry.runtime_data.async_refresh_recipes() for entry in entries)
+    )
+    if failed := [entry.title for entry, ok in zip(entries, results) if not ok]:
+        raise HomeAssistantError(
+            translation_domain=DOMAIN,
+            translation_key="recipes_not_refreshed",
+            translation_placeholders={"grinders": ", ".join(failed)},
+        )
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration's services."""
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_REFRESH_RECIPES,
+        _async_refresh_recipes,
+        schema=REFRESH_RECIPES_SCHEMA,
+    )
@@ -0,0 +1,105 @@
+"""HTTP/WebSocket client session for Mahlkönig X54 grinders."""
+
+import socket
+from datetime import timedelta
+
+import aiohttp
+from aiohttp.abc import AbstractResolver, ResolveResult
+from aiohttp_asyncmdnsresolver.api import AsyncDualMDNSResolver
+
+from homeassistant.components import zeroconf
+from homeassistant.const import APPLICATION_NAME, __version__
+from homeassistant.core import HomeAssistant
+
+# Each grinder holds one WebSocket and, while fetching statistics, one HTTP
+# connection. The fleet already caps how many grinders talk at once, so the
+# connector itself doesn't limit the total.
+CONNECTIONS_PER_GRINDER = 2
+
+# Probes for a dead peer on sockets that have been idle this long. The
+# WebSocket heartbeat covers the live connection; this catches the HTTP
+# connections kept alive between statistics requests.
+TCP_KEEPALIVE_IDLE = timedelta(seconds=30)
+TCP_KEEPALIVE_INTERVAL = timedelta(seconds=10)
+TCP_KEEPALIVE_PROBES = 3
+
+
+class GrinderResolver(AbstractResolver):
+    """Resolves each grinder host once and keeps the addresses.
+
+    Grinders are configured by IP address or `.local` name and rarely move,
+    and resolving a `.local` name can take longer than connecting. An
+    address is only looked up again after it was forgotten, i.e. after the
+    grinder couldn't be reached on it.
+
+    Lookups go through mDNS on Home Assistant's zeroconf instance as well as
+    DNS, like Home Assistant's own client sessions, so `.local` names resolve
+    without mDNS support in the host's name service (e.g. in a container).
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize an empty cache."""
+        self._resolver = AsyncDualMDNSResolver(
+            async_zeroconf=zeroconf.async_get_async_zeroconf(hass)
+        )
+        self._cache: dict[tuple[str, int, int], list[ResolveResult]] = {}
+
+    async def resolve(
+        self, host: str, port: int = 0, family: socket.AddressFamily = socket.AF_INET
+    ) -> list[ResolveResult]:
+        """Return the addresses of `host`, resolving it on first use."""
+        key = (host, port, family)
+        if (addresses := self._cache.get(key)) is None:
+            addresses = self._cache[key] = await self._resolver.resolve(
+                host, port, family
+            )
+        return addresses
+
+    def forget(self, host: str) -> None:
+        """Drop the cached addresses of `host`."""
+        for key in [key for key in self._cache if key[0] == host]:
+            del self._cache[key]
+
+    async def close(self) -> None:
+        """Release the resolver; the shared zeroconf instance stays open."""
+        self._cache.clear()
+        await self._resolver.close()
+
+
+def _grinder_socket(addr_info: tuple) -> socket.socket:
+    """Create a socket with Nagle disabled and TCP keepalive enabled.
+
+    Grinder frames are small and latency bound, so they are sent right away.
+    """
+    family, type_, proto, _, _ = addr_info
+    sock = socket.socket(family=family, type=type_, proto=proto)
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    # The tuning options are not available on every platform.
+    for option, value in (
+        ("TCP_KEEPIDLE", TCP_KEEPALIVE_IDLE),
+        ("TCP_KEEPINTVL", TCP_KEEPALIVE_INTERVAL),
+    ):
+        if hasattr(socket, option):
+            sock.setsockopt(
+                socket.IPPROTO_TCP, getattr(socket, option), int(value.total_seconds())
+            )
+    if hasattr(socket, "TCP_KEEPCNT"):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, TCP_KEEPALIVE_PROBES)
+    return sock
+
+
+def create_grinder_session(resolver: GrinderResolver) -> aiohttp.ClientSession:
+    """Create the client session all grinders of an instance share."""
+    connector = aiohttp.TCPConnector(
+        limit=0,
+        limit_per_host=CONNECTIONS_PER_GRINDER,
+        resolver=resolver,
+        # The resolver caches on its own terms.
+        use_dns_cache=False,
+        socket_factory=_grinder_socket,
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        headers={"User-Agent": f"{APPLICATION_NAME}/{__version__}"},
+    )
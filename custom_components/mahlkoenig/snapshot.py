@@ -0,0 +1,145 @@
+"""Immutable view of the grinder state for Mahlkönig X54."""
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any, Self
+
+from mahlkoenig import Grinder
+from mahlkoenig.models import (
+    AutoSleepTimePreset,
+    MachineInfo,
+    Recipe,
+    Statistics,
+    SystemStatus,
+    WifiInfo,
+)
+
+from .breaker import BreakerState, CircuitBreaker
+from .grind import ShotDurationStats
+from .metrics import GrinderMetrics, MetricsSummary
+from .recipes import RecipeAttributeCache
+from .scheduler import Resource
+from .usage import UsageStats
+
+# Snapshot keys entities subscribe to. Besides `CONNECTED`, `BREAKER`,
+# `METRICS`, `SHOT_DURATIONS` and `USAGE`, every resource except the recipe list is one
+# key; recipes get one key per slot so editing one recipe doesn't touch the
+# sensors of the others.
+CONNECTED = "connected"
+BREAKER = "breaker"
+METRICS = "metrics"
+SHOT_DURATIONS = "shot_durations"
+USAGE = "usage"
+
+
+def recipe_key(recipe_no: int) -> str:
+    """Return the snapshot key of a single recipe slot."""
+    return f"recipe_{recipe_no}"
+
+
+def _first[T](live: T | None, stored: T | None) -> T | None:
+    return live if live is not None else stored
+
+
+@dataclass(frozen=True, slots=True)
+class GrinderSnapshot:
+    """Grinder state as of one coordinator update."""
+
+    connected: bool = False
+    breaker_state: BreakerState = BreakerState.CLOSED
+    next_probe: datetime | None = None
+    machine_info: MachineInfo | None = None
+    wifi_info: WifiInfo | None = None
+    system_status: SystemStatus | None = None
+    auto_sleep_time: AutoSleepTimePreset | None = None
+    statistics: Statistics | None = None
+    recipes: Mapping[int, Recipe] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+    metrics: MetricsSummary = MetricsSummary()
+    shot_durations: Mapping[str, ShotDurationStats] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+    usage: Mapping[str, UsageStats] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+    # Derived from `recipes`, so it takes no part in comparisons.
+    recipe_attributes: Mapping[int, Mapping[str, Any]] = field(
+        default_factory=lambda: MappingProxyType({}), compare=False
+    )
+
+    @classmethod
+    def from_grinder(
+        cls,
+        grinder: Grinder,
+        breaker: CircuitBreaker,
+        metrics: GrinderMetrics,
+        stored: Self | None = None,
+        recipe_attributes: RecipeAttributeCache | None = None,
+        shot_durations: Mapping[str, ShotDurationStats] | None = None,
+        usage: Mapping[str, UsageStats] | None = None,
+    ) -> Self:
+        """Capture the grinder client's cached state.
+
+        Whatever the client hasn't received since startup is taken from the
+        `stored` snapshot of a previous run.
+        """
+        if stored is None:
+            stored = cls()
+        if recipe_attributes is None:
+            recipe_attributes = RecipeAttributeCache()
+        recipes = {**stored.recipes, **grinder.recipes}
+        return cls(
+            connected=grinder.connected,
+            breaker_state=breaker.state,
+            next_probe=breaker.next_probe,
+            machine_info=_first(grinder.machine_info, stored.machine_info),
+            wifi_info=_first(grinder.wifi_info, stored.wifi_info),
+            system_status=grinder.system_status,
+            auto_sleep_time=_first(grinder.auto_sleep_time, stored.auto_sleep_time),
+            statistics=_first(grinder.statistics, stored.statistics),
+            recipes=MappingProxyType(recipes),
+            metrics=metrics.summary(),
+            shot_durations=shot_durations or MappingProxyType({}),
+            usage=usage or MappingProxyType({}),
+            recipe_attributes=MappingProxyType(
+                {
+                    recipe_no: recipe_attributes.get(recipe)
+                    for recipe_no, recipe in recipes.items()
+                }
+            ),
+        )
+
+    def changed_keys(self, previous: Self | None) -> set[str]:
+        """Return the snapshot keys whose value differs from `previous`."""
+        if previous is None:
+            previous = type(self)()
+        changed: set[str] = set()
+        if self.connected != previous.connected:
+            changed.add(CONNECTED)
+        if (self.breaker_state, self.next_probe) != (
+            previous.breaker_state,
+            previous.next_probe,
+        ):
+            changed.add(BREAKER)
+        if self.metrics != previous.metrics:
+            changed.add(METRICS)
+        if self.shot_durations != previous.shot_durations:
+            changed.add(SHOT_DURATIONS)
+        if self.usage != previous.usage:
+            changed.add(USAGE)
+        for key, value, old in (
+            (Resource.MACHINE_INFO, self.machine_info, previous.machine_info),
+            (Resource.WIFI_INFO, self.wifi_info, previous.wifi_info),
+            (Resource.SYSTEM_STATUS, self.system_status, previous.system_status),
+            (Resource.AUTO_SLEEP_TIME, self.auto_sleep_time, previous.auto_sleep_time),
+            (Resource.STATISTICS, self.statistics, previous.statistics),
+        ):
+            if value != old:
+                changed.add(key)
+        for recipe_no in self.recipes.keys() | previous.recipes.keys():
+            if self.recipes.get(recipe_no) != previous.recipes.get(recipe_no):
+                changed.add(recipe_key(recipe_no))
+        return changed
@@ -0,0 +1,156 @@
+"""Persistence of the last known grinder state for Mahlkönig X54."""
+
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import timedelta
+from types import MappingProxyType
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from mahlkoenig.models import (
+    AutoSleepTimePreset,
+    MachineInfo,
+    Recipe,
+    Statistics,
+    WifiInfo,
+)
+from pydantic import BaseModel, ValidationError
+
+from .const import DOMAIN
+from .grind import ShotDurations
+from .scheduler import Resource
+from .snapshot import BREAKER, CONNECTED, METRICS, GrinderSnapshot
+from .usage import UsageRates
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+# Saves are coalesced: however often the state changes, it is written at most
+# once per delay (and on shutdown).
+SAVE_DELAY = timedelta(seconds=30)
+
+# Snapshot keys that aren't stored; a change of only these needs no save.
+VOLATILE_KEYS = frozenset({CONNECTED, BREAKER, METRICS, Resource.SYSTEM_STATUS})
+
+
+def _dump(model: BaseModel, scale: float = 1) -> dict[str, Any]:
+    """Serialize a model so that it validates again.
+
+    Pydantic writes timedeltas as ISO 8601 durations, but the models only
+    accept them in the grinder's wire units: seconds, scaled by `scale`.
+    """
+    data = model.model_dump(mode="json", by_alias=True)
+    for name, field in type(model).model_fields.items():
+        value = getattr(model, name)
+        if isinstance(value, timedelta):
+            data[field.alias or name] = value.total_seconds() * scale
+    return data
+
+
+def _load[T: BaseModel](model: type[T], data: dict[str, Any] | None) -> T | None:
+    """Validate stored data, dropping it if the library no longer accepts it."""
+    if data is None:
+        return None
+    try:
+        return model.model_validate(data)
+    except ValidationError as err:
+        _LOGGER.debug("Discarding stored %s: %s", model.__name__, err)
+        return None
+
+
+@dataclass(frozen=True, slots=True)
+class StoredState:
+    """What the previous run left behind."""
+
+    snapshot: GrinderSnapshot
+    shot_durations: dict[str, Any]
+    usage: dict[str, Any]
+
+
+class SnapshotStore:
+    """Keeps the cacheable part of a grinder snapshot on disk.
+
+    The live system status is left out; it is meaningless after a restart.
+    Shot duration histograms and usage windows are kept alongside, since
+    they are built here rather than read from the grinder.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the store of one config entry."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}"
+        )
+        # The data of the last scheduled save, until it was flushed.
+        self._pending: Callable[[], dict[str, Any]] | None = None
+
+    async def async_load(self) -> StoredState | None:
+        """Return the stored state, if any."""
+        if (data := await self._store.async_load()) is None:
+            return None
+        auto_sleep_time = data.get("auto_sleep_time")
+        recipes = (_load(Recipe, recipe) for recipe in data.get("recipes", []))
+        snapshot = GrinderSnapshot(
+            machine_info=_load(MachineInfo, data.get("machine_info")),
+            wifi_info=_load(WifiInfo, data.get("wifi_info")),
+            statistics=_load(Statistics, data.get("statistics")),
+            auto_sleep_time=(
+                AutoSleepTimePreset(auto_sleep_time)
+                if auto_sleep_time in AutoSleepTimePreset
+                else None
+            ),
+            recipes=MappingProxyType(
+                {recipe.recipe_no: recipe for recipe in recipes if recipe is not None}
+            ),
+        )
+        return StoredState(
+            snapshot=snapshot,
+            shot_durations=data.get("shot_durations", {}),
+            usage=data.get("usage", {}),
+        )
+
+    @callback
+    def async_schedule_save(
+        self,
+        snapshot: GrinderSnapshot,
+        shot_durations: ShotDurations,
+        usage: UsageRates,
+    ) -> None:
+        """Write the state after `SAVE_DELAY`, replacing any pending save."""
+        self._pending = lambda: self._serialize(snapshot, shot_durations, usage)
+        self._store.async_delay_save(self._pending, SAVE_DELAY.total_seconds())
+
+    async def async_flush(self) -> None:
+        """Write a scheduled save right away and drop its timer.
+
+        Called on unload, so that no delayed write of an entry that is being
+        removed recreates its file after `async_remove`.
+        """
+        if (pending := self._pending) is None:
+            return
+        self._pending = None
+        await self._store.async_save(pending())
+
+    async def async_remove(self) -> None:
+        """Delete the stored snapshot."""
+        await self._store.async_remove()
+
+    @staticmethod
+    def _serialize(
+        snapshot: GrinderSnapshot, shot_durations: ShotDurations, usage: UsageRates
+    ) -> dict[str, Any]:
+        return {
+            "machine_info": snapshot.machine_info and _dump(snapshot.machine_info),
+            "wifi_info": snapshot.wifi_info and _dump(snapshot.wifi_info),
+            "statistics": snapshot.statistics and _dump(snapshot.statistics),
+            "auto_sleep_time": snapshot.auto_sleep_time,
+            # A recipe's grind time is sent in deciseconds.
+            "recipes": [
+                _dump(recipe, scale=10) for recipe in snapshot.recipes.values()
+            ],
+            "shot_durations": shot_durations.as_dict(),
+            "usage": usage.as_dict(),
+        }
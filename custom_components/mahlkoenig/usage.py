@@ -0,0 +1,244 @@
+"""Usage rates derived from the counters of Mahlkönig X54."""
+
+from collections import deque
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from types import MappingProxyType
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+from mahlkoenig.models import Statistics
+
+from .grind import MANUAL, SHOT_SLOTS
+
+# Usage is tracked for the grinder as a whole and per shot slot.
+TOTAL = "total"
+USAGE_SERIES = (TOTAL, *SHOT_SLOTS)
+
+# Shots per hour are counted over a sliding window. Samples within the same
+# resolution step are merged, which bounds the ring buffer of a window.
+RATE_WINDOW = timedelta(hours=1)
+RATE_RESOLUTION = timedelta(minutes=1)
+RATE_SAMPLES = int(RATE_WINDOW / RATE_RESOLUTION) + 2
+
+
+def _counters(statistics: Statistics, series: str) -> tuple[int, timedelta]:
+    """Return the shot counter and grind time of `series`."""
+    if series == TOTAL:
+        return statistics.total_grind_shots, statistics.total_grind_time
+    if series == MANUAL:
+        return statistics.manual_mode_grind_shots, statistics.manual_mode_grind_time
+    return (
+        getattr(statistics, f"recipe_{series}_grind_shots"),
+        getattr(statistics, f"recipe_{series}_grind_time"),
+    )
+
+
+class CounterWindow:
+    """Sliding window and daily total of one grinder counter.
+
+    The grinder's counters only grow, except when a firmware update resets
+    them. A drop is taken as a reset to zero: the value before it is carried
+    as an offset, so the window and the daily total stay continuous. Adding
+    a sample is O(1) amortized, and the ring buffer never holds more than
+    `RATE_SAMPLES` samples.
+    """
+
+    __slots__ = ("_samples", "_raw", "_offset", "_day", "_day_start")
+
+    def __init__(self) -> None:
+        """Initialize a window without samples."""
+        self._samples: deque[tuple[float, float]] = deque(maxlen=RATE_SAMPLES)
+        self._raw: float | None = None
+        self._offset = 0.0
+        self._day: date | None = None
+        self._day_start = 0.0
+
+    @property
+    def value(self) -> float | None:
+        """Return the continuous counter value, if any sample was added."""
+        return self._samples[-1][1] if self._samples else None
+
+    def add(self, when: datetime, raw: float) -> None:
+        """Add the counter value the grinder reported at `when`."""
+        if self._raw is not None and raw < self._raw:
+            self._offset += self._raw
+        self._raw = raw
+        value = raw + self._offset
+        self.rollover(when, value)
+
+        timestamp = when.timestamp()
+        samples = self._samples
+        # One sample per resolution step: a newer one in the same step
+        # replaces it.
+        step = RATE_RESOLUTION.total_seconds()
+        if samples and samples[-1][0] // step == timestamp // step:
+            samples[-1] = (timestamp, value)
+        else:
+            samples.append((timestamp, value))
+        self._expire(timestamp)
+
+    def _expire(self, timestamp: float) -> None:
+        """Drop the samples no longer needed for the window ending then."""
+        # Keep one sample from before the window as the baseline.
+        samples = self._samples
+        window_start = timestamp - RATE_WINDOW.total_seconds()
+        while len(samples) >= 2 and samples[1][0] <= window_start:
+            samples.popleft()
+
+    def rollover(self, when: datetime, value: float | None = None) -> None:
+        """Start a new day if `when` is on a later (local) day."""
+        day = dt_util.as_local(when).date()
+        if day == self._day:
+            return
+        self._day = day
+        # The last value seen before midnight is where the new day starts.
+        if (last := self.value) is not None:
+            self._day_start = last
+        elif value is not None:
+            self._day_start = value
+
+    def per_window(self, when: datetime) -> float | None:
+        """Return how much the counter grew within the window ending at `when`.
+
+        The baseline is the value at the start of the window, interpolated
+        between the samples around it. Samples may be hours apart while the
+        grinder sleeps, and growth before the window must not count.
+        """
+        if not self._samples:
+            return None
+        timestamp = when.timestamp()
+        self._expire(timestamp)
+        window_start = timestamp - RATE_WINDOW.total_seconds()
+        samples = self._samples
+        first_at, baseline = samples[0]
+        if first_at < window_start:
+            if len(samples) == 1:
+                return 0.0
+            next_at, next_value = samples[1]
+            baseline += (
+                (next_value - baseline)
+                * (window_start - first_at)
+                / (next_at - first_at)
+            )
+        return samples[-1][1] - baseline
+
+    def today(self, day: date) -> float | None:
+        """Return how much the counter grew on `day`."""
+        if (value := self.value) is None:
+            return None
+        if day != self._day:
+            return 0.0
+        return value - self._day_start
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the window for storage."""
+        return {
+            "samples": [list(sample) for sample in self._samples],
+            "raw": self._raw,
+            "offset": self._offset,
+            "day": self._day and self._day.isoformat(),
+            "day_start": self._day_start,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "CounterWindow":
+        """Restore a window stored by `as_dict`."""
+        window = cls()
+        window._samples.extend(
+            (float(timestamp), float(value)) for timestamp, value in data["samples"]
+        )
+        window._raw = data["raw"]
+        window._offset = float(data["offset"])
+        window._day = data["day"] and date.fromisoformat(data["day"])
+        window._day_start = float(data["day_start"])
+        return window
+
+
+@dataclass(frozen=True, slots=True)
+class UsageStats:
+    """Usage of one series: the grinder as a whole or one shot slot."""
+
+    shots_per_hour: float | None = None
+    shots_today: float | None = None
+    grind_time_today: float | None = None
+
+
+class UsageRates:
+    """Shot and grind time rates of every usage series.
+
+    Fed with every statistics response. The stats are recomputed with each
+    sample and on `refresh`, which is meant to run at least once per
+    `RATE_RESOLUTION`, so the hourly rate decays and the daily totals reset
+    without new samples.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty windows."""
+        self._shots = {series: CounterWindow() for series in USAGE_SERIES}
+        self._grind_time = {series: CounterWindow() for series in USAGE_SERIES}
+        self._stats = self._summarize(dt_util.utcnow())
+
+    def _summarize(self, when: datetime) -> Mapping[str, UsageStats]:
+        day = dt_util.as_local(when).date()
+        window_hours = RATE_WINDOW / timedelta(hours=1)
+        stats = {}
+        for series in USAGE_SERIES:
+            shots = self._shots[series].per_window(when)
+            stats[series] = UsageStats(
+                shots_per_hour=(
+                    None if shots is None else round(shots / window_hours, 1)
+                ),
+                shots_today=self._shots[series].today(day),
+                grind_time_today=self._grind_time[series].today(day),
+            )
+        return MappingProxyType(stats)
+
+    @property
+    def stats(self) -> Mapping[str, UsageStats]:
+        """Return the current usage of every series."""
+        return self._stats
+
+    def record(self, when: datetime, statistics: Statistics) -> None:
+        """Add the counters of a statistics response received at `when`."""
+        for series in USAGE_SERIES:
+            shots, grind_time = _counters(statistics, series)
+            self._shots[series].add(when, shots)
+            self._grind_time[series].add(when, grind_time.total_seconds())
+        self._stats = self._summarize(when)
+
+    def refresh(self, when: datetime) -> None:
+        """Recompute the stats for `when` without a new sample."""
+        for windows in (self._shots, self._grind_time):
+            for window in windows.values():
+                window.rollover(when)
+        self._stats = self._summarize(when)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the windows for storage."""
+        return {
+            "shots": {
+                series: window.as_dict() for series, window in self._shots.items()
+            },
+            "grind_time": {
+                series: window.as_dict()
+                for series, window in self._grind_time.items()
+            },
+        }
+
+    def load(self, data: Mapping[str, Any]) -> None:
+        """Restore windows stored by `as_dict`, skipping unreadable ones."""
+        for name, windows in (
+            ("shots", self._shots),
+            ("grind_time", self._grind_time),
+        ):
+            for series, stored in data.get(name, {}).items():
+                if series not in windows:
+                    continue
+                try:
+                    windows[series] = CounterWindow.from_dict(stored)
+                except (KeyError, TypeError, ValueError):
+                    continue
+        self._stats = self._summarize(dt_util.utcnow())
@@ -0,0 +1 @@
+"""Tests for the Mahlkönig X54 integration."""
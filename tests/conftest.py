@@ -0,0 +1,41 @@
+"""Fixtures for Mahlkönig X54 tests."""
+
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from mahlkoenig.models import Statistics
+
+
+class FakeClock:
+    """Monotonic clock that only moves when told to."""
+
+    def __init__(self) -> None:
+        """Start at zero."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """Return a fake clock."""
+    return FakeClock()
+
+
+@pytest.fixture
+def make_statistics() -> Callable[..., Statistics]:
+    """Return a factory for grinder statistics with all counters at zero.
+
+    Counters are passed by field name; grind times in seconds.
+    """
+
+    def make(**counters: int) -> Statistics:
+        values: dict[str, Any] = dict.fromkeys(Statistics.model_fields, 0)
+        values.update(counters)
+        return Statistics.model_validate(values, by_name=True)
+
+    return make
@@ -0,0 +1,106 @@
+"""Tests for the Mahlkönig X54 circuit breaker."""
+
+from datetime import timedelta
+
+import pytest
+
+from custom_components.mahlkoenig.breaker import BreakerState, CircuitBreaker
+
+from .conftest import FakeClock
+
+
+@pytest.fixture(autouse=True)
+def no_jitter(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Use the full probe delay, without jitter."""
+    monkeypatch.setattr(
+        "custom_components.mahlkoenig.breaker.random.uniform", lambda low, high: high
+    )
+
+
+@pytest.fixture
+def breaker(clock: FakeClock) -> CircuitBreaker:
+    """Return a breaker that opens after three failures."""
+    return CircuitBreaker(
+        failure_threshold=3,
+        base_delay=timedelta(seconds=10),
+        max_delay=timedelta(seconds=60),
+        clock=clock,
+    )
+
+
+def test_opens_after_threshold(breaker: CircuitBreaker) -> None:
+    """Test that the breaker opens on the threshold-th failure."""
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state is BreakerState.CLOSED
+    assert breaker.allow_request()
+    assert breaker.next_probe is None
+
+    breaker.record_failure()
+    assert breaker.state is BreakerState.OPEN
+    assert not breaker.allow_request()
+    assert breaker.seconds_until_probe() == 10
+    assert breaker.next_probe is not None
+
+
+def test_half_open_probe(breaker: CircuitBreaker, clock: FakeClock) -> None:
+    """Test that a due probe is let through and its failure reopens."""
+    for _ in range(3):
+        breaker.record_failure()
+
+    clock.now = 9.9
+    assert not breaker.allow_request()
+    clock.now = 10
+    assert breaker.allow_request()
+    assert breaker.state is BreakerState.HALF_OPEN
+    assert breaker.seconds_until_probe() == 0
+
+    # Every failed probe doubles the delay, up to the maximum.
+    breaker.record_failure()
+    assert breaker.state is BreakerState.OPEN
+    assert breaker.seconds_until_probe() == 20
+    for delay in (40, 60, 60):
+        clock.now += breaker.seconds_until_probe()
+        assert breaker.allow_request()
+        breaker.record_failure()
+        assert breaker.seconds_until_probe() == delay
+
+
+def test_successful_probe_closes(breaker: CircuitBreaker, clock: FakeClock) -> None:
+    """Test that a successful probe closes the breaker and resets the delay."""
+    for _ in range(3):
+        breaker.record_failure()
+    clock.now = 10
+    assert breaker.allow_request()
+
+    breaker.record_success()
+    assert breaker.state is BreakerState.CLOSED
+    assert breaker.next_probe is None
+
+    # The count starts over, and so does the delay.
+    for _ in range(3):
+        breaker.record_failure()
+    assert breaker.seconds_until_probe() == 10
+
+
+def test_reset(breaker: CircuitBreaker) -> None:
+    """Test that a reset closes an open breaker right away."""
+    for _ in range(3):
+        breaker.record_failure()
+
+    breaker.reset()
+    assert breaker.state is BreakerState.CLOSED
+    assert breaker.allow_request()
+
+
+def test_jitter_shortens_delay(clock: FakeClock) -> None:
+    """Test that the jittered delay is between half and all of the delay."""
+    breaker = CircuitBreaker(1, timedelta(seconds=10), timedelta(seconds=60), clock)
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(
+            "custom_components.mahlkoenig.breaker.random.uniform",
+            lambda low, high: low,
+        )
+        breaker.record_failure()
+
+    assert breaker.seconds_until_probe() == 5
@@ -0,0 +1,135 @@
+"""Tests for the Mahlkönig X54 long-term statistics import."""
+
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.mahlkoenig.longterm import COUNTERS, StatisticsImporter
+
+TOTAL_SHOTS = "mahlkoenig:grinder_1_total_grind_shots"
+
+
+class Clock:
+    """Stand-in for `dt_util.utcnow` that only moves when told to."""
+
+    def __init__(self) -> None:
+        """Start at the beginning of an hour."""
+        self.now = datetime(2026, 10, 17, 8, 0, tzinfo=UTC)
+
+    def __call__(self) -> datetime:
+        """Return the current time."""
+        return self.now
+
+    def set(self, hour: int, minute: int = 0, second: int = 0) -> None:
+        """Move to a time on the same day."""
+        self.now = self.now.replace(hour=hour, minute=minute, second=second)
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    """Control the current time of the importer."""
+    clock = Clock()
+    monkeypatch.setattr(dt_util, "utcnow", clock)
+    return clock
+
+
+@pytest.fixture
+def imported() -> Iterator[dict[str, list]]:
+    """Capture the rows handed to the recorder, per statistic id."""
+    rows: dict[str, list] = {}
+
+    def add(hass, metadata, statistics) -> None:
+        rows.setdefault(metadata["statistic_id"], []).extend(statistics)
+
+    with patch(
+        "custom_components.mahlkoenig.longterm.async_add_external_statistics", add
+    ):
+        yield rows
+
+
+@pytest.fixture
+def coordinator() -> MagicMock:
+    """Return a coordinator of a grinder without statistics yet."""
+    coordinator = MagicMock()
+    coordinator.config_entry.unique_id = "grinder-1"
+    coordinator.config_entry.title = "X54"
+    coordinator.data.statistics = None
+    return coordinator
+
+
+def totals(rows: list) -> list[tuple[int, float, float]]:
+    """Return the hour, state and sum of each row."""
+    return [(row["start"].hour, row["state"], row["sum"]) for row in rows]
+
+
+async def test_counter_reset_keeps_sum_growing(
+    clock: Clock, imported: dict[str, list], coordinator: MagicMock, make_statistics
+) -> None:
+    """Test that a counter reset is carried into the sum as an offset."""
+    importer = StatisticsImporter(MagicMock(), coordinator)
+
+    clock.set(8, 10)
+    coordinator.data.statistics = make_statistics(total_grind_shots=110)
+    importer.async_observe()
+    clock.set(8, 40)
+    coordinator.data.statistics = make_statistics(total_grind_shots=3)
+    importer.async_observe()
+    clock.set(9, 0, 10)
+    importer.async_import()
+
+    assert totals(imported[TOTAL_SHOTS]) == [(8, 3, 113)]
+    assert len(imported) == len(COUNTERS)
+
+
+async def test_start_recovers_offsets(
+    clock: Clock, imported: dict[str, list], coordinator: MagicMock, make_statistics
+) -> None:
+    """Test that the offsets continue from the rows already in the recorder."""
+    hass = MagicMock()
+    importer = StatisticsImporter(hass, coordinator)
+    last_rows = {
+        metadata["statistic_id"]: {
+            "start": datetime(2026, 10, 17, 7, tzinfo=UTC).timestamp(),
+            "state": 3.0,
+            "sum": 113.0,
+        }
+        for metadata in importer._metadata.values()
+    }
+    recorder = MagicMock()
+    recorder.async_add_executor_job = AsyncMock(return_value=last_rows)
+
+    clock.set(8, 30)
+    coordinator.data.statistics = make_statistics(total_grind_shots=5)
+    with (
+        patch(
+            "custom_components.mahlkoenig.longterm.get_instance",
+            return_value=recorder,
+        ),
+        patch("custom_components.mahlkoenig.longterm.async_track_utc_time_change"),
+    ):
+        await importer.async_start(MagicMock())
+    # The hour before was imported already.
+    assert imported == {}
+
+    # Nothing is seen while the grinder sleeps; the values are carried forward.
+    clock.set(10, 0, 10)
+    importer.async_import()
+
+    assert totals(imported[TOTAL_SHOTS]) == [(8, 5, 115), (9, 5, 115)]
+
+
+async def test_nothing_imported_before_statistics(
+    clock: Clock, imported: dict[str, list], coordinator: MagicMock
+) -> None:
+    """Test that no rows are written before any statistics were seen."""
+    importer = StatisticsImporter(MagicMock(), coordinator)
+
+    importer.async_observe()
+    clock.set(9, 0, 10)
+    importer.async_import()
+
+    assert imported == {}
@@ -0,0 +1,89 @@
+"""Tests for the Mahlkönig X54 metrics."""
+
+import pytest
+
+from custom_components.mahlkoenig.metrics import GrinderMetrics, Histogram
+from custom_components.mahlkoenig.scheduler import Resource
+
+
+def test_empty_histogram() -> None:
+    """Test that an empty histogram has no quantiles or mean."""
+    histogram = Histogram((1.0, 2.0))
+
+    assert histogram.quantile(0.5) is None
+    assert histogram.mean is None
+
+
+def test_quantile_interpolates_within_bucket() -> None:
+    """Test that a quantile is interpolated inside its bucket."""
+    histogram = Histogram((1.0, 2.0))
+    for value in (0.2, 0.4, 0.6, 0.8):
+        histogram.add(value)
+
+    # Halfway through the first bucket, clamped to the values seen.
+    assert histogram.quantile(0.5) == pytest.approx(0.5)
+    assert histogram.quantile(0.0) == pytest.approx(0.2)
+    assert histogram.mean == pytest.approx(0.5)
+
+
+def test_quantile_in_top_bucket() -> None:
+    """Test that p95 in the overflow bucket is bounded by the largest value."""
+    histogram = Histogram((1.0, 2.0))
+    for _ in range(90):
+        histogram.add(0.5)
+    for value in range(10):
+        histogram.add(2.5 + value * 0.5)
+
+    # 5 of the 10 values above the last bound, which span 2.0 to 7.0.
+    assert histogram.quantile(0.95) == pytest.approx(4.5)
+    assert histogram.quantile(1.0) == pytest.approx(7.0)
+
+
+def test_quantile_of_single_value() -> None:
+    """Test that a single observation is every quantile."""
+    histogram = Histogram((1.0, 2.0))
+    histogram.add(1.5)
+
+    assert histogram.quantile(0.05) == pytest.approx(1.5)
+    assert histogram.quantile(0.95) == pytest.approx(1.5)
+
+
+def test_round_trip() -> None:
+    """Test that a histogram survives `as_dict` and `from_dict`."""
+    histogram = Histogram((1.0, 2.0))
+    for value in (0.5, 1.5, 3.0):
+        histogram.add(value)
+
+    restored = Histogram.from_dict(histogram.as_dict())
+
+    assert restored.as_dict() == histogram.as_dict()
+    assert restored.quantile(0.95) == histogram.quantile(0.95)
+
+
+def test_from_dict_with_other_buckets() -> None:
+    """Test that counts stored with a different bucket count are dropped."""
+    stored = Histogram((1.0, 2.0))
+    stored.add(0.5)
+    data = stored.as_dict() | {"counts": [1, 0]}
+
+    restored = Histogram.from_dict(data)
+
+    assert restored.count == 0
+    assert restored.quantile(0.5) is None
+
+
+def test_grinder_metrics_summary() -> None:
+    """Test that the summary reflects recorded ticks and requests."""
+    metrics = GrinderMetrics()
+    metrics.record_tick(0.2, budget=5.0)
+    metrics.record_tick(6.0, budget=5.0)
+    metrics.record_request(Resource.STATISTICS, 0.02)
+    metrics.record_connect(0.1, success=False)
+
+    summary = metrics.summary()
+
+    assert summary.tick_overruns == 1
+    assert summary.connects == 1
+    assert summary.connect_failures == 1
+    assert summary.request_p95 == pytest.approx(0.02)
+    assert metrics.as_dict()["requests"][Resource.STATISTICS]["count"] == 1
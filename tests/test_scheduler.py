@@ -0,0 +1,81 @@
+"""Tests for the Mahlkönig X54 resource scheduler."""
+
+from datetime import timedelta
+
+import pytest
+
+from custom_components.mahlkoenig.scheduler import (
+    Resource,
+    ResourcePolicy,
+    ResourceScheduler,
+)
+
+from .conftest import FakeClock
+
+POLICIES = {
+    Resource.SYSTEM_STATUS: ResourcePolicy(ttl=timedelta(seconds=10), priority=0),
+    Resource.STATISTICS: ResourcePolicy(ttl=timedelta(minutes=5), priority=2),
+    Resource.AUTO_SLEEP_TIME: ResourcePolicy(ttl=timedelta(minutes=1), priority=1),
+}
+
+
+@pytest.fixture
+def scheduler(clock: FakeClock) -> ResourceScheduler:
+    """Return a scheduler with every resource due."""
+    return ResourceScheduler(POLICIES, clock)
+
+
+def test_all_due_by_priority(scheduler: ResourceScheduler) -> None:
+    """Test that every resource is due at first, highest priority first."""
+    assert scheduler.pop_due() == [
+        Resource.SYSTEM_STATUS,
+        Resource.AUTO_SLEEP_TIME,
+        Resource.STATISTICS,
+    ]
+    assert scheduler.pop_due() == []
+
+
+def test_complete_waits_for_ttl(
+    scheduler: ResourceScheduler, clock: FakeClock
+) -> None:
+    """Test that a completed resource is due again after its TTL."""
+    for resource in scheduler.pop_due():
+        scheduler.complete(resource)
+
+    clock.now = 9.9
+    assert scheduler.pop_due() == []
+    clock.now = 60
+    assert scheduler.pop_due() == [Resource.SYSTEM_STATUS, Resource.AUTO_SLEEP_TIME]
+
+
+def test_requeue(scheduler: ResourceScheduler, clock: FakeClock) -> None:
+    """Test that a requeued resource is due on the next tick."""
+    scheduler.pop_due()
+    scheduler.requeue(Resource.STATISTICS)
+
+    assert scheduler.pop_due() == [Resource.STATISTICS]
+
+
+def test_mark_due_supersedes_deadline(
+    scheduler: ResourceScheduler, clock: FakeClock
+) -> None:
+    """Test that marking a resource due replaces its pending deadline."""
+    for resource in scheduler.pop_due():
+        scheduler.complete(resource)
+
+    scheduler.mark_due(Resource.STATISTICS)
+    assert scheduler.pop_due() == [Resource.STATISTICS]
+
+    # The superseded deadline doesn't bring the resource back.
+    clock.now = 300
+    assert Resource.STATISTICS not in scheduler.pop_due()
+
+
+def test_mark_all_due(scheduler: ResourceScheduler) -> None:
+    """Test that marking all due returns each resource once."""
+    for resource in scheduler.pop_due():
+        scheduler.complete(resource)
+
+    scheduler.mark_all_due()
+    scheduler.mark_all_due()
+    assert len(scheduler.pop_due()) == len(POLICIES)
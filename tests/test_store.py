@@ -0,0 +1,123 @@
+"""Tests for the Mahlkönig X54 snapshot store."""
+
+from collections.abc import Iterator
+from datetime import timedelta
+from types import MappingProxyType
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from mahlkoenig.models import AutoSleepTimePreset, Recipe
+
+from custom_components.mahlkoenig.grind import ShotDurations
+from custom_components.mahlkoenig.snapshot import GrinderSnapshot
+from custom_components.mahlkoenig.store import SAVE_DELAY, SnapshotStore
+from custom_components.mahlkoenig.usage import UsageRates
+
+RECIPE = {
+    "RecipeNo": 1,
+    # Deciseconds, as the grinder sends it.
+    "GrindTime": 35,
+    "Name": "Espresso",
+    "BeanName": "House Blend",
+    "GrindingDegree": 12,
+    "BrewingType": 2,
+    "Guid": "0001",
+    "LastModifyIndex": 4,
+    "LastModifyTime": "2026-01-01T00:00:00+00:00",
+}
+
+
+@pytest.fixture
+def store() -> Iterator[MagicMock]:
+    """Patch the Home Assistant store and return the mock instance."""
+    with patch("custom_components.mahlkoenig.store.Store") as store_class:
+        instance = store_class.return_value
+        instance.async_load = AsyncMock(return_value=None)
+        instance.async_save = AsyncMock()
+        instance.async_remove = AsyncMock()
+        yield instance
+
+
+async def test_load_without_file(store: MagicMock) -> None:
+    """Test that nothing is loaded before the first save."""
+    assert await SnapshotStore(MagicMock(), "entry").async_load() is None
+
+
+async def test_round_trip(store: MagicMock, make_statistics) -> None:
+    """Test that a saved snapshot loads back unchanged."""
+    recipe = Recipe.model_validate(RECIPE)
+    snapshot = GrinderSnapshot(
+        statistics=make_statistics(total_grind_shots=42, total_grind_time=300),
+        auto_sleep_time=AutoSleepTimePreset.MIN_10,
+        recipes=MappingProxyType({1: recipe}),
+    )
+    shot_durations = ShotDurations()
+    shot_durations.record("1", timedelta(seconds=3.5))
+    usage = UsageRates()
+    data = SnapshotStore._serialize(snapshot, shot_durations, usage)
+    store.async_load.return_value = data
+
+    stored = await SnapshotStore(MagicMock(), "entry").async_load()
+
+    assert stored is not None
+    assert stored.snapshot.statistics == snapshot.statistics
+    assert stored.snapshot.auto_sleep_time is AutoSleepTimePreset.MIN_10
+    assert stored.snapshot.recipes == {1: recipe}
+    assert stored.snapshot.recipes[1].grind_time == timedelta(seconds=3.5)
+    assert stored.shot_durations == shot_durations.as_dict()
+    assert stored.usage == usage.as_dict()
+
+
+async def test_load_older_snapshot(store: MagicMock, make_statistics) -> None:
+    """Test that a snapshot from before histograms and usage were kept loads."""
+    store.async_load.return_value = {
+        "machine_info": None,
+        "wifi_info": None,
+        "statistics": None,
+        "auto_sleep_time": AutoSleepTimePreset.MIN_3,
+        "recipes": [],
+    }
+
+    stored = await SnapshotStore(MagicMock(), "entry").async_load()
+
+    assert stored is not None
+    assert stored.snapshot.auto_sleep_time is AutoSleepTimePreset.MIN_3
+    assert stored.shot_durations == {}
+    assert stored.usage == {}
+
+
+async def test_load_discards_invalid_parts(store: MagicMock) -> None:
+    """Test that parts the library no longer accepts are dropped one by one."""
+    store.async_load.return_value = {
+        "statistics": {"TotalGrindShots": "many"},
+        "auto_sleep_time": 42,
+        "recipes": [RECIPE, RECIPE | {"RecipeNo": -1}],
+    }
+
+    stored = await SnapshotStore(MagicMock(), "entry").async_load()
+
+    assert stored is not None
+    assert stored.snapshot.statistics is None
+    assert stored.snapshot.auto_sleep_time is None
+    assert list(stored.snapshot.recipes) == [1]
+
+
+async def test_flush_writes_pending_save(store: MagicMock) -> None:
+    """Test that a flush writes the scheduled save right away, once."""
+    snapshot_store = SnapshotStore(MagicMock(), "entry")
+    await snapshot_store.async_flush()
+    store.async_save.assert_not_awaited()
+
+    snapshot_store.async_schedule_save(
+        GrinderSnapshot(auto_sleep_time=AutoSleepTimePreset.MIN_5),
+        ShotDurations(),
+        UsageRates(),
+    )
+    store.async_delay_save.assert_called_once()
+    assert store.async_delay_save.call_args.args[1] == SAVE_DELAY.total_seconds()
+
+    await snapshot_store.async_flush()
+    await snapshot_store.async_flush()
+    store.async_save.assert_awaited_once()
+    assert store.async_save.call_args.args[0]["auto_sleep_time"] == 300
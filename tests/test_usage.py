@@ -0,0 +1,152 @@
+"""Tests for the Mahlkönig X54 usage rates."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from custom_components.mahlkoenig.usage import (
+    RATE_SAMPLES,
+    TOTAL,
+    CounterWindow,
+    UsageRates,
+)
+
+START = datetime(2026, 10, 17, 8, 0, tzinfo=UTC)
+
+
+def minutes(count: float) -> datetime:
+    """Return the time `count` minutes after `START`."""
+    return START + timedelta(minutes=count)
+
+
+def test_counter_reset_is_continuous() -> None:
+    """Test that a counter dropping to a low value counts from zero."""
+    window = CounterWindow()
+    window.add(minutes(0), 100)
+    window.add(minutes(1), 110)
+    window.add(minutes(2), 3)
+
+    assert window.value == 113
+    assert window.per_window(minutes(2)) == 13
+    assert window.today(START.date()) == 13
+
+    window.add(minutes(3), 5)
+    assert window.value == 115
+
+
+def test_samples_in_one_step_are_merged() -> None:
+    """Test that a newer sample in the same minute replaces the older one."""
+    window = CounterWindow()
+    window.add(minutes(0), 1)
+    window.add(minutes(0.5), 2)
+
+    assert window.as_dict()["samples"] == [[minutes(0.5).timestamp(), 2.0]]
+
+
+def test_ring_buffer_is_bounded() -> None:
+    """Test that the window keeps no more samples than it needs."""
+    window = CounterWindow()
+    for minute in range(3 * RATE_SAMPLES):
+        window.add(minutes(minute), minute)
+
+    assert len(window.as_dict()["samples"]) <= RATE_SAMPLES
+    assert window.per_window(minutes(3 * RATE_SAMPLES - 1)) == 60
+
+
+def test_window_decays_without_samples() -> None:
+    """Test that growth leaves the window once it is an hour old."""
+    window = CounterWindow()
+    window.add(minutes(0), 0)
+    window.add(minutes(10), 6)
+
+    assert window.per_window(minutes(10)) == 6
+    assert window.per_window(minutes(60)) == 6
+    # The growth is spread over the ten minutes between the samples.
+    assert window.per_window(minutes(65)) == pytest.approx(3)
+    assert window.per_window(minutes(70)) == 0
+    assert window.per_window(minutes(300)) == 0
+
+
+def test_window_interpolates_baseline() -> None:
+    """Test that growth before the window start is not counted.
+
+    The grinder slept between two samples two hours apart, so half of the
+    growth between them falls into the last hour.
+    """
+    window = CounterWindow()
+    window.add(minutes(0), 0)
+    window.add(minutes(120), 12)
+
+    assert window.per_window(minutes(120)) == pytest.approx(6)
+
+
+def test_window_without_samples() -> None:
+    """Test that an empty window has no growth."""
+    window = CounterWindow()
+
+    assert window.value is None
+    assert window.per_window(START) is None
+    assert window.today(START.date()) is None
+
+
+def test_rollover_starts_new_day() -> None:
+    """Test that the daily total starts from the last value before midnight."""
+    window = CounterWindow()
+    late = datetime(2026, 10, 17, 23, 50, tzinfo=UTC)
+    window.add(late, 10)
+    window.add(late + timedelta(minutes=5), 12)
+
+    window.rollover(late + timedelta(minutes=15))
+    next_day = (late + timedelta(minutes=15)).date()
+    assert window.today(next_day) == 0
+    assert window.today(late.date()) == 0
+
+    window.add(late + timedelta(minutes=20), 15)
+    assert window.today(next_day) == 3
+
+
+def test_window_round_trip() -> None:
+    """Test that a window survives `as_dict` and `from_dict`."""
+    window = CounterWindow()
+    window.add(minutes(0), 100)
+    window.add(minutes(1), 3)
+
+    restored = CounterWindow.from_dict(window.as_dict())
+
+    assert restored.as_dict() == window.as_dict()
+    restored.add(minutes(2), 4)
+    assert restored.value == 104
+
+
+def test_usage_rates(make_statistics) -> None:
+    """Test the shots per hour and daily totals of the grinder."""
+    rates = UsageRates()
+    rates.record(minutes(0), make_statistics(total_grind_shots=10))
+    rates.record(
+        minutes(30), make_statistics(total_grind_shots=16, total_grind_time=90)
+    )
+
+    stats = rates.stats[TOTAL]
+    assert stats.shots_per_hour == 6.0
+    assert stats.shots_today == 6
+    assert stats.grind_time_today == 90
+
+    rates.refresh(minutes(120))
+    stats = rates.stats[TOTAL]
+    assert stats.shots_per_hour == 0.0
+    assert stats.shots_today == 6
+
+
+def test_usage_rates_load_skips_unreadable(make_statistics) -> None:
+    """Test that stored windows that can't be read are left empty."""
+    rates = UsageRates()
+    rates.record(minutes(0), make_statistics(total_grind_shots=10))
+    stored = rates.as_dict()
+    stored["shots"]["1"] = {"samples": "garbage"}
+    stored["shots"]["unknown"] = stored["shots"][TOTAL]
+
+    restored = UsageRates()
+    restored.load(stored)
+
+    assert restored.as_dict()["shots"][TOTAL] == stored["shots"][TOTAL]
+    assert restored.as_dict()["shots"]["1"]["samples"] == []